@@ -6,11 +6,14 @@ Create Date: 2025-02-10 22:20:52.065876
 
 """
 
-from collections.abc import Sequence
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 import sqlalchemy as sa
 from alembic import op
 from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import OperationalError
 
 # revision identifiers, used by Alembic.
 revision: str = "8fc8eca45073"
@@ -18,6 +21,102 @@ down_revision: str | None = None
 branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
+# Column changes on the existing investor tables. Each table only locks itself, so these
+# run in parallel on separate connections. DEFAULT now() is deliberate: now() is STABLE,
+# so ADD COLUMN stores it as a fast default instead of rewriting the table (a VOLATILE
+# clock_timestamp() would not).
+TIMESTAMP_COLUMN_CHANGES = {
+    table: f"""
+        ALTER TABLE {table}
+            ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT now(),
+            ALTER COLUMN created_at TYPE TIMESTAMPTZ
+        """
+    for table in ("investor_chunks", "investors", "portfolio_companies", "team_members")
+}
+
+# Adding a foreign key also locks the referenced investors table, so these cannot overlap
+# with the column changes above and run one after another once those are done. A foreign
+# key left behind by an interrupted run is dropped and re-added, which is cheap while NOT VALID.
+FOREIGN_KEY_CHANGES = {
+    table: f"""
+        ALTER TABLE {table}
+            DROP CONSTRAINT IF EXISTS {table}_investor_id_fkey,
+            DROP CONSTRAINT IF EXISTS fk_{table}_investor_id,
+            ADD CONSTRAINT fk_{table}_investor_id
+                FOREIGN KEY (investor_id) REFERENCES investors (id) ON DELETE CASCADE NOT VALID
+        """
+    for table in ("investor_chunks", "portfolio_companies", "team_members")
+}
+
+FOREIGN_KEYS_TO_VALIDATE = (
+    ("investor_chunks", "fk_investor_chunks_investor_id"),
+    ("portfolio_companies", "fk_portfolio_companies_investor_id"),
+    ("team_members", "fk_team_members_investor_id"),
+)
+
+# Bound how long DDL on the existing investor tables may wait for its lock, so it fails
+# fast (and is retried) instead of queueing every other query behind it
+LOCK_TIMEOUT = "2s"
+LOCK_RETRY_ATTEMPTS = 5
+LOCK_RETRY_BACKOFF_SECONDS = 1.0
+LOCK_NOT_AVAILABLE = "55P03"
+
+
+def _retry_on_lock_timeout(execute: Callable[[], None]) -> None:
+    """Call execute, retrying with exponential backoff when it times out waiting for a lock."""
+    for attempt in range(1, LOCK_RETRY_ATTEMPTS + 1):
+        try:
+            execute()
+            return
+        except OperationalError as e:
+            if getattr(e.orig, "pgcode", None) != LOCK_NOT_AVAILABLE or attempt == LOCK_RETRY_ATTEMPTS:
+                raise
+            time.sleep(LOCK_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+
+
+def _execute_with_lock_retry(statement: str) -> None:
+    """Execute a DDL statement in an autocommit block, retrying when it times out waiting for a lock."""
+    if op.get_context().as_sql:
+        op.execute(statement)
+        return
+
+    # In autocommit mode each attempt is its own transaction, so a timed-out attempt
+    # leaves nothing to roll back and its locks are released straight away
+    bind = op.get_bind()
+    _retry_on_lock_timeout(lambda: bind.execute(sa.text(statement)))
+
+
+def _execute_on_own_connection(engine: sa.Engine, statement: str, timezone: str) -> None:
+    """Execute a DDL statement on a dedicated autocommit connection, retrying on lock timeouts."""
+    with engine.connect() as connection:
+        connection.execution_options(isolation_level="AUTOCOMMIT")
+        connection.exec_driver_sql(f"SET lock_timeout = '{LOCK_TIMEOUT}'")
+        # TIMESTAMP -> TIMESTAMPTZ reads the existing values in the session timezone, so use
+        # the migration session's own instead of whatever this connection started with.
+        # When it is UTC the change is binary-compatible (PostgreSQL 12+) and skips the rewrite.
+        connection.exec_driver_sql("SELECT set_config('TimeZone', %(timezone)s, false)", {"timezone": timezone})
+        _retry_on_lock_timeout(lambda: connection.exec_driver_sql(statement))
+
+
+def _execute_in_parallel(statements: Sequence[str]) -> None:
+    """Execute independent DDL statements concurrently, one connection per statement."""
+    if op.get_context().as_sql:
+        # A generated script runs on a single session, so apply the same settings to it
+        op.execute(f"SET lock_timeout = '{LOCK_TIMEOUT}'")
+        for statement in statements:
+            op.execute(statement)
+        op.execute("RESET lock_timeout")
+        return
+
+    bind = op.get_bind()
+    timezone = bind.exec_driver_sql("SELECT current_setting('TimeZone')").scalar_one()
+    with ThreadPoolExecutor(max_workers=len(statements)) as executor:
+        futures = [
+            executor.submit(_execute_on_own_connection, bind.engine, statement, timezone) for statement in statements
+        ]
+        for future in futures:
+            future.result()
+
 
 def upgrade() -> None:
     # Create users table first
@@ -30,9 +129,10 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
         sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
         sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
     )
-    op.create_index(op.f("ix_users_clerk_id"), "users", ["clerk_id"], unique=True)
-    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=False)
+    op.create_index(op.f("ix_users_clerk_id"), "users", ["clerk_id"], unique=True, if_not_exists=True)
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=False, if_not_exists=True)
 
     # Create credit system tables
     op.create_table(
@@ -47,6 +147,7 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
         sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
         sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
     )
     op.create_table(
         "feature_costs",
@@ -61,6 +162,7 @@ def upgrade() -> None:
         sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("feature_key"),
+        if_not_exists=True,
     )
     op.create_table(
         "credit_balances",
@@ -72,6 +174,7 @@ def upgrade() -> None:
         sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
         sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
         sa.PrimaryKeyConstraint("user_id"),
+        if_not_exists=True,
     )
     op.create_table(
         "credit_transactions",
@@ -88,61 +191,29 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["feature_key"], ["feature_costs.feature_key"], ondelete="SET NULL"),
         sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
         sa.PrimaryKeyConstraint("id"),
+        if_not_exists=True,
     )
 
-    # Add timestamps to existing tables
-    op.add_column(
-        "investor_chunks",
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
-    )
-    op.alter_column(
-        "investor_chunks",
-        "created_at",
-        existing_type=postgresql.TIMESTAMP(),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.drop_constraint("investor_chunks_investor_id_fkey", "investor_chunks", type_="foreignkey")
-    op.create_foreign_key("fk_investor_chunks_investor_id", "investor_chunks", "investors", ["investor_id"], ["id"], ondelete="CASCADE")
+    # Changes to the existing investor tables run statement by statement in autocommit
+    # mode, so each table's locks are released as soon as its own statement finishes
+    # instead of at the end of the migration. This also commits the new tables first,
+    # which the parallel worker connections could not otherwise see. A failure from here
+    # on leaves those tables in place with the revision unstamped, so every step above
+    # and below is safe to run again.
+    #
+    # The foreign keys are added NOT VALID to skip the full-table check while the
+    # ACCESS EXCLUSIVE lock is held; VALIDATE CONSTRAINT then only needs a
+    # SHARE UPDATE EXCLUSIVE lock, so writes continue while existing rows are checked.
+    with op.get_context().autocommit_block():
+        _execute_in_parallel(list(TIMESTAMP_COLUMN_CHANGES.values()))
 
-    op.add_column(
-        "investors", sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True)
-    )
-    op.alter_column(
-        "investors",
-        "created_at",
-        existing_type=postgresql.TIMESTAMP(),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-
-    op.add_column(
-        "portfolio_companies",
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
-    )
-    op.alter_column(
-        "portfolio_companies",
-        "created_at",
-        existing_type=postgresql.TIMESTAMP(),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.drop_constraint("portfolio_companies_investor_id_fkey", "portfolio_companies", type_="foreignkey")
-    op.create_foreign_key("fk_portfolio_companies_investor_id", "portfolio_companies", "investors", ["investor_id"], ["id"], ondelete="CASCADE")
+        op.execute(f"SET lock_timeout = '{LOCK_TIMEOUT}'")
+        for statement in FOREIGN_KEY_CHANGES.values():
+            _execute_with_lock_retry(statement)
+        op.execute("RESET lock_timeout")
 
-    op.add_column(
-        "team_members",
-        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
-    )
-    op.alter_column(
-        "team_members",
-        "created_at",
-        existing_type=postgresql.TIMESTAMP(),
-        type_=sa.DateTime(timezone=True),
-        existing_nullable=True,
-    )
-    op.drop_constraint("team_members_investor_id_fkey", "team_members", type_="foreignkey")
-    op.create_foreign_key("fk_team_members_investor_id", "team_members", "investors", ["investor_id"], ["id"], ondelete="CASCADE")
+        for table, constraint in FOREIGN_KEYS_TO_VALIDATE:
+            op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {constraint}")
 
 
 def downgrade() -> None:
@@ -152,50 +223,41 @@ def downgrade() -> None:
     op.drop_table("feature_costs")
     op.drop_table("credit_packages")
 
-    # Remove timestamps from existing tables
-    op.drop_constraint("fk_team_members_investor_id", "team_members", type_="foreignkey")
-    op.create_foreign_key("team_members_investor_id_fkey", "team_members", "investors", ["investor_id"], ["id"])
-    op.alter_column(
-        "team_members",
-        "created_at",
-        existing_type=sa.DateTime(timezone=True),
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
-    )
-    op.drop_column("team_members", "updated_at")
-
-    op.drop_constraint("fk_portfolio_companies_investor_id", "portfolio_companies", type_="foreignkey")
-    op.create_foreign_key(
-        "portfolio_companies_investor_id_fkey", "portfolio_companies", "investors", ["investor_id"], ["id"]
+    # Remove timestamps from existing tables, one multi-clause ALTER TABLE per table
+    op.execute(
+        """
+        ALTER TABLE team_members
+            DROP CONSTRAINT fk_team_members_investor_id,
+            ADD CONSTRAINT team_members_investor_id_fkey FOREIGN KEY (investor_id) REFERENCES investors (id),
+            ALTER COLUMN created_at TYPE TIMESTAMP,
+            DROP COLUMN updated_at
+        """
     )
-    op.alter_column(
-        "portfolio_companies",
-        "created_at",
-        existing_type=sa.DateTime(timezone=True),
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
+    op.execute(
+        """
+        ALTER TABLE portfolio_companies
+            DROP CONSTRAINT fk_portfolio_companies_investor_id,
+            ADD CONSTRAINT portfolio_companies_investor_id_fkey FOREIGN KEY (investor_id) REFERENCES investors (id),
+            ALTER COLUMN created_at TYPE TIMESTAMP,
+            DROP COLUMN updated_at
+        """
     )
-    op.drop_column("portfolio_companies", "updated_at")
-
-    op.alter_column(
-        "investors",
-        "created_at",
-        existing_type=sa.DateTime(timezone=True),
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
+    op.execute(
+        """
+        ALTER TABLE investors
+            ALTER COLUMN created_at TYPE TIMESTAMP,
+            DROP COLUMN updated_at
+        """
     )
-    op.drop_column("investors", "updated_at")
-
-    op.drop_constraint("fk_investor_chunks_investor_id", "investor_chunks", type_="foreignkey")
-    op.create_foreign_key("investor_chunks_investor_id_fkey", "investor_chunks", "investors", ["investor_id"], ["id"])
-    op.alter_column(
-        "investor_chunks",
-        "created_at",
-        existing_type=sa.DateTime(timezone=True),
-        type_=postgresql.TIMESTAMP(),
-        existing_nullable=True,
+    op.execute(
+        """
+        ALTER TABLE investor_chunks
+            DROP CONSTRAINT fk_investor_chunks_investor_id,
+            ADD CONSTRAINT investor_chunks_investor_id_fkey FOREIGN KEY (investor_id) REFERENCES investors (id),
+            ALTER COLUMN created_at TYPE TIMESTAMP,
+            DROP COLUMN updated_at
+        """
     )
-    op.drop_column("investor_chunks", "updated_at")
 
     # Drop users table last since other tables depend on it
     op.drop_index(op.f("ix_users_email"), table_name="users")
@@ -0,0 +1,67 @@
+"""Index credit transaction history and invoice lookups
+
+Revision ID: add_credit_lookup_indexes
+Revises: merge_heads_for_billing
+Create Date: 2025-02-20 09:00
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_credit_lookup_indexes'
+down_revision: Union[str, None] = 'merge_heads_for_billing'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently outside the migration transaction so existing tables stay writable.
+    with op.get_context().autocommit_block():
+        # Serves "latest transactions for a user"
+        op.create_index(
+            'ix_credit_transactions_user_created',
+            'credit_transactions',
+            ['user_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Foreign key and ownership lookups on invoices
+        op.create_index(
+            op.f('ix_credit_invoices_user_id'),
+            'credit_invoices',
+            ['user_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f('ix_credit_invoices_transaction_id'),
+            'credit_invoices',
+            ['transaction_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_credit_invoices_transaction_id'),
+            table_name='credit_invoices',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            op.f('ix_credit_invoices_user_id'),
+            table_name='credit_invoices',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_credit_transactions_user_created',
+            table_name='credit_transactions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
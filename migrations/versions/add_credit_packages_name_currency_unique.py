@@ -0,0 +1,35 @@
+"""Make credit packages unique by name and currency
+
+Revision ID: add_credit_packages_name_currency_unique
+Revises: add_credit_lookup_indexes
+Create Date: 2025-02-20 09:10
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_credit_packages_name_currency_unique'
+down_revision: Union[str, None] = 'add_credit_lookup_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build the unique index without blocking writes, then attach it as the constraint,
+    # which only needs a brief lock. Duplicate packages must be removed by hand first.
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS uq_credit_packages_name_currency '
+            'ON credit_packages (name, currency)'
+        )
+    op.execute(
+        'ALTER TABLE credit_packages '
+        'ADD CONSTRAINT uq_credit_packages_name_currency UNIQUE USING INDEX uq_credit_packages_name_currency'
+    )
+
+
+def downgrade() -> None:
+    # Dropping the constraint also drops its index
+    op.execute('ALTER TABLE credit_packages DROP CONSTRAINT IF EXISTS uq_credit_packages_name_currency')
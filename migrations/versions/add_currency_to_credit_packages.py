@@ -18,16 +18,11 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add currency column with default value
-    op.add_column('credit_packages', sa.Column('currency', sa.String(3), nullable=False, server_default='usd'))
-
-    # Update existing packages to use USD
-    op.execute("""
-        UPDATE credit_packages
-        SET currency = 'usd'
-        WHERE currency = 'usd'
-    """)
+    # Add currency column with default value; the server default also backfills
+    # existing packages with 'usd', so no separate UPDATE pass is needed.
+    # IF NOT EXISTS makes a re-run against an already migrated schema a no-op.
+    op.execute("ALTER TABLE credit_packages ADD COLUMN IF NOT EXISTS currency VARCHAR(3) NOT NULL DEFAULT 'usd'")
 
 
 def downgrade() -> None:
-    op.drop_column('credit_packages', 'currency')
+    op.execute("ALTER TABLE credit_packages DROP COLUMN IF EXISTS currency")
@@ -5,8 +5,12 @@ Revises: d1b7e45b1fc7
 Create Date: 2024-02-14 20:04:00.000000
 
 """
+import csv
+import io
+import uuid
 from typing import Sequence, Union
 
+import sqlalchemy as sa
 from alembic import op
 
 # revision identifiers, used by Alembic.
@@ -15,24 +19,84 @@ down_revision: Union[str, None] = 'add_currency_to_credit_packages'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# (name, credits, price_cents, currency, tier, savings_percentage)
+DEFAULT_PACKAGES = [
+    # USD Packages
+    ('Starter Pack (USD)', 100, 500, 'usd', 'basic', 0),
+    ('Pro Pack (USD)', 500, 2000, 'usd', 'pro', 20),
+    ('Business Pack (USD)', 2000, 7000, 'usd', 'business', 30),
+    ('Enterprise Pack (USD)', 5000, 15000, 'usd', 'enterprise', 40),
+    # EUR Packages (converted at approximate rate of 1 USD = 0.93 EUR)
+    ('Starter Pack (EUR)', 100, 465, 'eur', 'basic', 0),
+    ('Pro Pack (EUR)', 500, 1860, 'eur', 'pro', 20),
+    ('Business Pack (EUR)', 2000, 6510, 'eur', 'business', 30),
+    ('Enterprise Pack (EUR)', 5000, 13950, 'eur', 'enterprise', 40),
+]
+
+PACKAGE_COLUMNS = ('id', 'name', 'credits', 'price_cents', 'currency', 'tier', 'savings_percentage', 'is_active')
+
+
+def _package_rows() -> list[tuple]:
+    """Build the default package rows in PACKAGE_COLUMNS order, with client-side ids."""
+    return [(uuid.uuid4(), *package, True) for package in DEFAULT_PACKAGES]
+
+
+def _copy_packages(rows: list[tuple]) -> None:
+    """Stream rows into credit_packages with COPY, skipping packages that already exist.
+
+    COPY cannot skip existing rows itself, so the rows land in a temporary staging table
+    first and are moved over with a single INSERT ... SELECT that leaves out packages
+    whose name and currency are already present.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+
+    columns = ', '.join(PACKAGE_COLUMNS)
+    cursor = op.get_bind().connection.cursor()
+    try:
+        cursor.execute(
+            'CREATE TEMP TABLE credit_packages_seed (LIKE credit_packages INCLUDING DEFAULTS) ON COMMIT DROP'
+        )
+        cursor.copy_expert(f'COPY credit_packages_seed ({columns}) FROM STDIN WITH (FORMAT csv)', buffer)
+        cursor.execute(
+            f'INSERT INTO credit_packages ({columns}) SELECT {columns} FROM credit_packages_seed AS seed '
+            'WHERE NOT EXISTS ('
+            'SELECT 1 FROM credit_packages AS p WHERE p.name = seed.name AND p.currency = seed.currency'
+            ')'
+        )
+    finally:
+        cursor.close()
+
 
 def upgrade() -> None:
-    # Insert default credit packages
+    rows = _package_rows()
+    if not op.get_context().as_sql:
+        _copy_packages(rows)
+        return
+
+    # Offline (--sql) mode has no connection to stream to; insert from an inline VALUES list instead
+    credit_packages = sa.table(
+        'credit_packages',
+        sa.column('id', sa.Uuid()),
+        sa.column('name', sa.String()),
+        sa.column('credits', sa.Integer()),
+        sa.column('price_cents', sa.Integer()),
+        sa.column('currency', sa.String()),
+        sa.column('tier', sa.String()),
+        sa.column('savings_percentage', sa.Integer()),
+        sa.column('is_active', sa.Boolean()),
+    )
+    seed = sa.values(*(sa.column(c.name, c.type) for c in credit_packages.c), name='seed').data(rows)
+    existing = sa.select(credit_packages.c.id).where(
+        credit_packages.c.name == seed.c.name, credit_packages.c.currency == seed.c.currency
+    )
     op.execute(
-        """
-        INSERT INTO credit_packages (id, name, credits, price_cents, currency, tier, savings_percentage, is_active)
-        VALUES
-            -- USD Packages
-            (gen_random_uuid(), 'Starter Pack (USD)', 100, 500, 'usd', 'basic', 0, true),
-            (gen_random_uuid(), 'Pro Pack (USD)', 500, 2000, 'usd', 'pro', 20, true),
-            (gen_random_uuid(), 'Business Pack (USD)', 2000, 7000, 'usd', 'business', 30, true),
-            (gen_random_uuid(), 'Enterprise Pack (USD)', 5000, 15000, 'usd', 'enterprise', 40, true),
-            -- EUR Packages (converted at approximate rate of 1 USD = 0.93 EUR)
-            (gen_random_uuid(), 'Starter Pack (EUR)', 100, 465, 'eur', 'basic', 0, true),
-            (gen_random_uuid(), 'Pro Pack (EUR)', 500, 1860, 'eur', 'pro', 20, true),
-            (gen_random_uuid(), 'Business Pack (EUR)', 2000, 6510, 'eur', 'business', 30, true),
-            (gen_random_uuid(), 'Enterprise Pack (EUR)', 5000, 13950, 'eur', 'enterprise', 40, true)
-        """
+        credit_packages.insert().from_select(
+            list(PACKAGE_COLUMNS),
+            # The literal ids in VALUES are text, which has no assignment cast to uuid
+            sa.select(sa.cast(seed.c.id, sa.Uuid()), *list(seed.c)[1:]).where(~sa.exists(existing)),
+        )
     )
 
 
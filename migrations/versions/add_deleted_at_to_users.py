@@ -19,8 +19,9 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.add_column("users", sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True))
+    # IF NOT EXISTS makes a re-run against an already migrated schema a no-op
+    op.execute("ALTER TABLE users ADD COLUMN IF NOT EXISTS deleted_at TIMESTAMPTZ")
 
 
 def downgrade() -> None:
-    op.drop_column("users", "deleted_at")
+    op.execute("ALTER TABLE users DROP COLUMN IF EXISTS deleted_at")
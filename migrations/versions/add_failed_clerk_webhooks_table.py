@@ -0,0 +1,41 @@
+"""Add failed_clerk_webhooks table.
+
+Revision ID: add_failed_clerk_webhooks_table
+Revises: investor_chunks_hnsw_search
+Create Date: 2025-02-20 10:40
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "add_failed_clerk_webhooks_table"
+down_revision: Union[str, None] = "investor_chunks_hnsw_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create failed_clerk_webhooks table."""
+    op.create_table(
+        "failed_clerk_webhooks",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("message_id", sa.String(length=255), nullable=False),
+        sa.Column("event_type", sa.String(length=50), nullable=False),
+        sa.Column("clerk_id", sa.String(length=255), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("error", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_failed_clerk_webhooks_clerk_id"), "failed_clerk_webhooks", ["clerk_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Drop failed_clerk_webhooks table."""
+    op.drop_index(op.f("ix_failed_clerk_webhooks_clerk_id"), table_name="failed_clerk_webhooks")
+    op.drop_table("failed_clerk_webhooks")
@@ -0,0 +1,39 @@
+"""Index credit_transactions.feature_key
+
+Revision ID: add_feature_key_index
+Revises: add_credit_packages_name_currency_unique
+Create Date: 2025-02-20 09:20
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_feature_key_index'
+down_revision: Union[str, None] = 'add_credit_packages_name_currency_unique'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Lets ON DELETE SET NULL from feature_costs find referencing rows without a scan.
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_credit_transactions_feature_key'),
+            'credit_transactions',
+            ['feature_key'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f('ix_credit_transactions_feature_key'),
+            table_name='credit_transactions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,57 @@
+"""Index the remaining repository hot-path filters
+
+Revision ID: add_hot_path_indexes
+Revises: add_feature_key_index
+Create Date: 2025-02-20 10:00
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_hot_path_indexes'
+down_revision: Union[str, None] = 'add_feature_key_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so step out of
+    # the migration transaction and keep writes to both tables flowing while the indexes build.
+    with op.get_context().autocommit_block():
+        # Usage history, usage sums and purchased totals filter on user and transaction type,
+        # then on a created_at range
+        op.create_index(
+            'ix_credit_transactions_user_type_created',
+            'credit_transactions',
+            ['user_id', 'transaction_type', 'created_at'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # The package listing only ever reads active packages, per currency, ordered by credits
+        op.create_index(
+            'ix_credit_packages_active_currency_credits',
+            'credit_packages',
+            ['currency', 'credits'],
+            postgresql_where=sa.text('is_active'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_credit_packages_active_currency_credits',
+            table_name='credit_packages',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_credit_transactions_user_type_created',
+            table_name='credit_transactions',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
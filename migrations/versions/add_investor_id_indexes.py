@@ -0,0 +1,44 @@
+"""Index investor_id on the investor child tables
+
+Revision ID: add_investor_id_indexes
+Revises: drop_billing_info_stripe_customer_id_key
+Create Date: 2025-02-20 10:20
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_investor_id_indexes'
+down_revision: Union[str, None] = 'drop_billing_info_stripe_customer_id_key'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INVESTOR_CHILD_TABLES = ('team_members', 'portfolio_companies', 'investor_chunks')
+
+
+def upgrade() -> None:
+    # Built concurrently outside the migration transaction so the investor tables stay writable.
+    # IF NOT EXISTS skips databases bootstrapped from sql/investors.sql, which creates them too.
+    with op.get_context().autocommit_block():
+        # Serve per-investor lookups and ON DELETE CASCADE from investors
+        for table in INVESTOR_CHILD_TABLES:
+            op.create_index(
+                f'ix_{table}_investor_id',
+                table,
+                ['investor_id'],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in reversed(INVESTOR_CHILD_TABLES):
+            op.drop_index(
+                f'ix_{table}_investor_id',
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -18,31 +18,32 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add name column
-    op.add_column('billing_info', sa.Column('name', sa.String(length=255), nullable=True))
+    # Add name with a constant default (no table rewrite) and relax company_name in one ALTER.
+    # Every step is idempotent, so a re-run against an already migrated schema is a no-op.
+    op.execute(
+        """
+        ALTER TABLE billing_info
+            ADD COLUMN IF NOT EXISTS name VARCHAR(255) NOT NULL DEFAULT '',
+            ALTER COLUMN company_name DROP NOT NULL
+        """
+    )
 
     # Copy company_name to name for existing records
-    op.execute("UPDATE billing_info SET name = company_name")
+    op.execute("UPDATE billing_info SET name = company_name WHERE name = ''")
 
-    # Make name not nullable after populating it
-    op.alter_column('billing_info', 'name',
-                    existing_type=sa.String(length=255),
-                    nullable=False)
-
-    # Make company_name nullable
-    op.alter_column('billing_info', 'company_name',
-                    existing_type=sa.String(length=255),
-                    nullable=True)
+    # The default only existed to backfill the column
+    op.alter_column('billing_info', 'name', server_default=None)
 
 
 def downgrade() -> None:
     # Copy name back to company_name for any null company_names
     op.execute("UPDATE billing_info SET company_name = name WHERE company_name IS NULL")
 
-    # Make company_name not nullable again
-    op.alter_column('billing_info', 'company_name',
-                    existing_type=sa.String(length=255),
-                    nullable=False)
-
-    # Drop name column
-    op.drop_column('billing_info', 'name')
+    # Make company_name not nullable again and drop name in one ALTER
+    op.execute(
+        """
+        ALTER TABLE billing_info
+            ALTER COLUMN company_name SET NOT NULL,
+            DROP COLUMN IF EXISTS name
+        """
+    )
@@ -19,10 +19,10 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add updated_at column with server default
-    op.add_column('credit_invoices', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True))
+    # Add updated_at column with server default; the simplify revisions dropped the original one
+    op.execute("ALTER TABLE credit_invoices ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ DEFAULT now()")
 
 
 def downgrade() -> None:
     # Drop updated_at column
-    op.drop_column('credit_invoices', 'updated_at')
+    op.execute("ALTER TABLE credit_invoices DROP COLUMN IF EXISTS updated_at")
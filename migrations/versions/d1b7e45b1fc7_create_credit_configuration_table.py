@@ -34,6 +34,7 @@ def upgrade() -> None:
     op.execute("""
         INSERT INTO credit_configurations (key, value, description)
         VALUES ('signup_bonus', 50, 'Number of credits awarded to new users upon signup')
+        ON CONFLICT (key) DO NOTHING
     """)
 
 
@@ -0,0 +1,28 @@
+"""Drop the redundant billing_info stripe_customer_id unique constraint
+
+Revision ID: drop_billing_info_stripe_customer_id_key
+Revises: add_hot_path_indexes
+Create Date: 2025-02-20 10:10
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'drop_billing_info_stripe_customer_id_key'
+down_revision: Union[str, None] = 'add_hot_path_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The unique index ix_billing_info_stripe_customer_id already enforces uniqueness;
+    # the constraint only kept a second, identical index up to date on every write
+    op.execute('ALTER TABLE billing_info DROP CONSTRAINT billing_info_stripe_customer_id_key')
+
+
+def downgrade() -> None:
+    op.execute(
+        'ALTER TABLE billing_info ADD CONSTRAINT billing_info_stripe_customer_id_key UNIQUE (stripe_customer_id)'
+    )
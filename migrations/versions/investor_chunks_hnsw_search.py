@@ -0,0 +1,164 @@
+"""Search investor chunks through an HNSW inner-product index
+
+Revision ID: investor_chunks_hnsw_search
+Revises: add_investor_id_indexes
+Create Date: 2025-02-20 10:30
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'investor_chunks_hnsw_search'
+down_revision: Union[str, None] = 'add_investor_id_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Takes the nearest chunks from the index first, then applies the threshold, as in sql/investors.sql
+GET_INVESTOR_LEADS = """
+    CREATE OR REPLACE FUNCTION get_investor_leads(
+        query_embedding vector(1536),
+        match_threshold float,
+        match_count int
+    ) RETURNS TABLE (
+        investor_id bigint,
+        name text,
+        website text,
+        description text,
+        location text,
+        contact_email text,
+        contact_phone text,
+        contact_name text,
+        contact_form_url text,
+        investment_stages text[],
+        check_size jsonb,
+        industries text[],
+        geographies text[],
+        investment_thesis text,
+        similarity float
+    ) LANGUAGE sql STABLE
+    -- HNSW returns at most ef_search rows per scan; 1000 covers the candidate list for the API maximum of 100 investors
+    SET hnsw.ef_search = 1000
+    AS $$
+        -- Only ORDER BY <distance> LIMIT k can use the HNSW index, so take the nearest chunks first
+        -- and apply the threshold to those. Ten candidates per requested investor leave room for
+        -- investors with several close chunks and for inactive investors dropped by the join.
+        WITH nearest_chunks AS (
+            SELECT
+                investor_id,
+                -- <#> is the negated inner product, equal to cosine similarity for unit-length embeddings
+                -(embedding <#> query_embedding) AS similarity
+            FROM investor_chunks
+            ORDER BY embedding <#> query_embedding
+            LIMIT match_count * 10
+        ),
+        top_chunks AS (
+            SELECT DISTINCT ON (investor_id) investor_id, similarity
+            FROM nearest_chunks
+            WHERE similarity > match_threshold
+            ORDER BY investor_id, similarity DESC
+        )
+        SELECT
+            i.id AS investor_id,
+            i.name,
+            i.website,
+            i.description,
+            i.location,
+            i.contact_email,
+            i.contact_phone,
+            i.contact_name,
+            i.contact_form_url,
+            i.investment_stages,
+            i.check_size,
+            i.industries,
+            i.geographies,
+            i.investment_thesis,
+            tc.similarity
+        FROM top_chunks tc
+        JOIN investors i ON i.id = tc.investor_id
+        WHERE i.status = 'active'
+        ORDER BY tc.similarity DESC
+        LIMIT match_count;
+    $$
+"""
+
+# The full-scan cosine version created by the original sql/investors.sql
+PREVIOUS_GET_INVESTOR_LEADS = """
+    CREATE OR REPLACE FUNCTION get_investor_leads(
+        query_embedding vector(1536),
+        match_threshold float,
+        match_count int
+    ) RETURNS TABLE (
+        investor_id bigint,
+        name text,
+        website text,
+        description text,
+        location text,
+        contact_email text,
+        contact_phone text,
+        contact_name text,
+        contact_form_url text,
+        investment_stages text[],
+        check_size jsonb,
+        industries text[],
+        geographies text[],
+        investment_thesis text,
+        similarity float
+    ) LANGUAGE sql STABLE AS $$
+        WITH top_chunks AS (
+            SELECT DISTINCT ON (investor_id)
+                investor_id,
+                (1 - (embedding <=> query_embedding)) AS similarity
+            FROM investor_chunks
+            WHERE (1 - (embedding <=> query_embedding)) > match_threshold
+            ORDER BY investor_id, similarity DESC
+        )
+        SELECT
+            i.id AS investor_id,
+            i.name,
+            i.website,
+            i.description,
+            i.location,
+            i.contact_email,
+            i.contact_phone,
+            i.contact_name,
+            i.contact_form_url,
+            i.investment_stages,
+            i.check_size,
+            i.industries,
+            i.geographies,
+            i.investment_thesis,
+            tc.similarity
+        FROM top_chunks tc
+        JOIN investors i ON i.id = tc.investor_id
+        WHERE i.status = 'active'
+        ORDER BY tc.similarity DESC
+        LIMIT match_count;
+    $$
+"""
+
+
+def upgrade() -> None:
+    # Built concurrently outside the migration transaction so investor_chunks stays writable.
+    # The ivfflat index is dropped first; no query used it, as none ordered by the distance operator.
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS investor_chunks_embedding_idx')
+        op.execute("SET maintenance_work_mem = '128MB'")
+        op.execute(
+            'CREATE INDEX CONCURRENTLY investor_chunks_embedding_idx '
+            'ON investor_chunks USING hnsw (embedding vector_ip_ops) WITH (m = 16, ef_construction = 64)'
+        )
+        op.execute('RESET maintenance_work_mem')
+    # Replaced once the index exists, so the new candidate scan never runs without it
+    op.execute(GET_INVESTOR_LEADS)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_GET_INVESTOR_LEADS)
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS investor_chunks_embedding_idx')
+        op.execute(
+            'CREATE INDEX CONCURRENTLY investor_chunks_embedding_idx '
+            'ON investor_chunks USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)'
+        )
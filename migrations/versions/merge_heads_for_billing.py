@@ -1,7 +1,7 @@
 """Merge multiple heads for billing
 
 Revision ID: merge_heads_for_billing
-Revises: add_name_to_billing_info, add_billing_info_table, 3daf0fe01f2e, simplify_credit_invoices
+Revises: add_name_to_billing_info, add_billing_info_table
 Create Date: 2024-02-16 13:28
 
 """
@@ -19,12 +19,16 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Drop pdf related columns
-    op.drop_column('credit_invoices', 'pdf_generated')
-    op.drop_column('credit_invoices', 'pdf_path')
+    # Drop pdf related columns, which only exist on databases that had them added by hand
+    op.execute("ALTER TABLE credit_invoices DROP COLUMN IF EXISTS pdf_generated, DROP COLUMN IF EXISTS pdf_path")
 
 
 def downgrade() -> None:
     # Add back pdf related columns
-    op.add_column('credit_invoices', sa.Column('pdf_path', sa.String(255), nullable=True))
-    op.add_column('credit_invoices', sa.Column('pdf_generated', sa.Boolean(), server_default=sa.text('false'), nullable=False))
+    op.execute(
+        """
+        ALTER TABLE credit_invoices
+            ADD COLUMN IF NOT EXISTS pdf_path VARCHAR(255),
+            ADD COLUMN IF NOT EXISTS pdf_generated BOOLEAN NOT NULL DEFAULT false
+        """
+    )
@@ -19,38 +19,47 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add stripe_invoice_id column first
-    op.add_column('credit_invoices', sa.Column('stripe_invoice_id', sa.String(255), nullable=False))
-    op.create_unique_constraint('uq_credit_invoices_stripe_invoice_id', 'credit_invoices', ['stripe_invoice_id'])
-
-    # Drop unnecessary columns
-    op.drop_column('credit_invoices', 'amount_cents')
-    op.drop_column('credit_invoices', 'currency')
-    op.drop_column('credit_invoices', 'status')
-    op.drop_column('credit_invoices', 'metadata')
-    op.drop_column('credit_invoices', 'updated_at')
-
-    # Make created_at nullable
-    op.alter_column('credit_invoices', 'created_at',
-                    existing_type=sa.DateTime(),
-                    nullable=True,
-                    server_default=None)
+    # simplify_credit_invoices and 3daf0fe01f2e both branch off 5a25238141f0 and apply
+    # overlapping changes, so every step is guarded to let whichever runs second be a no-op
+    op.execute(
+        """
+        ALTER TABLE credit_invoices
+            ADD COLUMN IF NOT EXISTS stripe_invoice_id VARCHAR(255) NOT NULL,
+            DROP COLUMN IF EXISTS amount_cents,
+            DROP COLUMN IF EXISTS currency,
+            DROP COLUMN IF EXISTS status,
+            DROP COLUMN IF EXISTS metadata,
+            DROP COLUMN IF EXISTS updated_at,
+            ALTER COLUMN created_at DROP NOT NULL,
+            ALTER COLUMN created_at DROP DEFAULT
+        """
+    )
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'uq_credit_invoices_stripe_invoice_id') THEN
+                ALTER TABLE credit_invoices
+                    ADD CONSTRAINT uq_credit_invoices_stripe_invoice_id UNIQUE (stripe_invoice_id);
+            END IF;
+        END
+        $$
+        """
+    )
 
 
 def downgrade() -> None:
-    # Drop stripe_invoice_id column and its constraint
-    op.drop_constraint('uq_credit_invoices_stripe_invoice_id', 'credit_invoices', type_='unique')
-    op.drop_column('credit_invoices', 'stripe_invoice_id')
-
-    # Make created_at non-nullable with server default
-    op.alter_column('credit_invoices', 'created_at',
-                    existing_type=sa.DateTime(),
-                    nullable=False,
-                    server_default=sa.text('now()'))
-
-    # Add back removed columns
-    op.add_column('credit_invoices', sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False))
-    op.add_column('credit_invoices', sa.Column('metadata', sa.JSON(), nullable=True))
-    op.add_column('credit_invoices', sa.Column('status', sa.String(length=50), nullable=False))
-    op.add_column('credit_invoices', sa.Column('currency', sa.String(), nullable=False))
-    op.add_column('credit_invoices', sa.Column('amount_cents', sa.Integer(), nullable=False))
+    op.execute(
+        """
+        ALTER TABLE credit_invoices
+            DROP CONSTRAINT IF EXISTS uq_credit_invoices_stripe_invoice_id,
+            DROP COLUMN IF EXISTS stripe_invoice_id,
+            ALTER COLUMN created_at SET DEFAULT now(),
+            ALTER COLUMN created_at SET NOT NULL,
+            ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP NOT NULL DEFAULT now(),
+            ADD COLUMN IF NOT EXISTS metadata JSON,
+            ADD COLUMN IF NOT EXISTS status VARCHAR(50) NOT NULL,
+            ADD COLUMN IF NOT EXISTS currency VARCHAR NOT NULL,
+            ADD COLUMN IF NOT EXISTS amount_cents INTEGER NOT NULL
+        """
+    )
@@ -65,13 +65,20 @@ CREATE TABLE investor_chunks (
 DROP INDEX IF EXISTS investor_chunks_embedding_idx;
 SET maintenance_work_mem = '128MB';
 -- Create indices
+-- HNSW keeps its recall as the table grows and needs no rebuild after bulk inserts (pgvector >= 0.5).
+-- OpenAI embeddings are unit length, so inner product equals cosine similarity without the norms
 CREATE INDEX investor_chunks_embedding_idx
-ON investor_chunks USING ivfflat (embedding vector_cosine_ops)
-WITH (lists = 100);
+ON investor_chunks USING hnsw (embedding vector_ip_ops)
+WITH (m = 16, ef_construction = 64);
 
 CREATE INDEX investors_active_status_idx
 ON investors (id) WHERE status = 'active';
 
+-- Foreign keys are not indexed implicitly; these serve per-investor lookups and cascading deletes
+CREATE INDEX ix_team_members_investor_id ON team_members (investor_id);
+CREATE INDEX ix_portfolio_companies_investor_id ON portfolio_companies (investor_id);
+CREATE INDEX ix_investor_chunks_investor_id ON investor_chunks (investor_id);
+
 -- Create similarity search function
 CREATE OR REPLACE FUNCTION get_investor_leads(
     query_embedding vector(1536),
@@ -93,13 +100,26 @@ CREATE OR REPLACE FUNCTION get_investor_leads(
     geographies text[],
     investment_thesis text,
     similarity float
-) LANGUAGE sql STABLE AS $$
-    WITH top_chunks AS (
-        SELECT DISTINCT ON (investor_id)
+) LANGUAGE sql STABLE
+-- HNSW returns at most ef_search rows per scan; 1000 covers the candidate list for the API maximum of 100 investors
+SET hnsw.ef_search = 1000
+AS $$
+    -- Only ORDER BY <distance> LIMIT k can use the HNSW index, so take the nearest chunks first
+    -- and apply the threshold to those. Ten candidates per requested investor leave room for
+    -- investors with several close chunks and for inactive investors dropped by the join.
+    WITH nearest_chunks AS (
+        SELECT
             investor_id,
-            (1 - (embedding <=> query_embedding)) AS similarity
+            -- <#> is the negated inner product, equal to cosine similarity for unit-length embeddings
+            -(embedding <#> query_embedding) AS similarity
         FROM investor_chunks
-        WHERE (1 - (embedding <=> query_embedding)) > match_threshold
+        ORDER BY embedding <#> query_embedding
+        LIMIT match_count * 10
+    ),
+    top_chunks AS (
+        SELECT DISTINCT ON (investor_id) investor_id, similarity
+        FROM nearest_chunks
+        WHERE similarity > match_threshold
         ORDER BY investor_id, similarity DESC
     )
     SELECT
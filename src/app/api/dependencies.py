@@ -1,158 +1,201 @@
 """Provides FastAPI dependency injection configurations for the Pareo API.
 
 It contains dependency providers that handle the creation and injection of services
-and configurations needed throughout the application. The dependencies are designed
-to be efficient through caching and proper resource management.
+and configurations needed throughout the application. The whole dependency graph is
+built once at startup and stored on the application state, so resolving a dependency
+on the request path is a single attribute lookup.
 """
 
-from functools import lru_cache
-from typing import Annotated
-
-from fastapi import Depends
+import httpx
+from fastapi import FastAPI, Request
 from openai import AsyncOpenAI
 from pydantic_ai.models.openai import OpenAIModel
 
-from app.core.config import get_settings
+from app.core.config import settings
 from app.core.database import DatabaseSessionManager
 from app.repositories.billing_repository import BillingRepository
 from app.repositories.credit_repository import CreditRepository
 from app.repositories.user_repository import UserRepository
 from app.services.billing_service import BillingService
 from app.services.clerk_user_sync_service import ClerkUserSyncService
+from app.services.clerk_webhook_queue import ClerkWebhookQueue
 from app.services.credit_service import CreditService
 from app.services.investor_finder import InvestorFinder
 from app.services.investor_oracle import InvestorOracle
 from app.services.payment_service import PaymentService
 
 
-@lru_cache
-def get_openai_client() -> AsyncOpenAI:
-    """Create and cache an OpenAI client instance.
+def init_services(app: FastAPI) -> None:
+    """Create the shared clients, repositories and services and store them on the app state.
+
+    Called once from the application lifespan, in dependency order.
+
+    Args:
+        app: The FastAPI application whose state receives the instances.
+
+    """
+    state = app.state
+
+    state.http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30),
+        timeout=httpx.Timeout(30.0, connect=10.0),
+    )
+    state.openai_client = AsyncOpenAI(api_key=settings.openai_api_key, http_client=state.http_client)
+    state.reasoning_model = OpenAIModel(
+        settings.reasoning_model,
+        base_url=settings.openrouter_base_url,
+        api_key=settings.openrouter_api_key,
+        http_client=state.http_client,
+    )
+    state.db_session_manager = DatabaseSessionManager(
+        settings.database_url,
+        {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            # Recycle connections before the server's idle timeout instead of pinging on every checkout;
+            # pre-ping stays available as an opt-in for environments with unreliable networks
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_pre_ping": settings.db_pool_pre_ping,
+            "pool_timeout": settings.db_pool_timeout,
+            # Reuse the most recently returned connection so the hot subset stays warm
+            "pool_use_lifo": True,
+            "query_cache_size": settings.db_query_cache_size,
+            "connect_args": {
+                # Let TCP keepalives detect dead connections instead of a per-checkout round trip
+                "server_settings": {"tcp_keepalives_idle": str(settings.db_tcp_keepalives_idle)},
+                "command_timeout": settings.db_command_timeout,
+            },
+        },
+    )
+
+    state.user_repository = UserRepository(state.db_session_manager)
+    state.credit_repository = CreditRepository(state.db_session_manager)
+    state.billing_repository = BillingRepository(state.db_session_manager)
+
+    state.credit_service = CreditService(state.credit_repository)
+    state.billing_service = BillingService(state.billing_repository)
+    state.payment_service = PaymentService(state.credit_repository, state.billing_service)
+    state.clerk_sync_service = ClerkUserSyncService(state.user_repository, state.credit_repository, state.http_client)
+    state.clerk_webhook_queue = ClerkWebhookQueue(state.clerk_sync_service)
+    state.investor_finder = InvestorFinder(
+        openai_client=state.openai_client,
+        reasoning_model=state.reasoning_model,
+        embedding_model_name=settings.embedding_model,
+        db_session_manager=state.db_session_manager,
+    )
+    state.investor_oracle = InvestorOracle(
+        investor_finder=state.investor_finder,
+        openai_client=state.openai_client,
+    )
+
+
+async def close_services(app: FastAPI) -> None:
+    """Drain the webhook queue, close the shared HTTP client and dispose of the database engine.
+
+    Args:
+        app: The FastAPI application whose state holds the instances.
+
+    """
+    await app.state.clerk_webhook_queue.stop()
+    await app.state.http_client.aclose()
+    await app.state.db_session_manager.close()
+
+
+# FastAPI runs plain `def` dependencies in its threadpool, so every provider is a coroutine
+# that only reads the instance built by init_services().
+
+
+async def get_http_client(request: Request) -> httpx.AsyncClient:
+    """Return the HTTP client shared by the OpenAI, OpenRouter and Clerk API clients.
+
+    Returns:
+        httpx.AsyncClient: HTTP/2-enabled client with a shared connection pool.
+
+    """
+    return request.app.state.http_client
+
+
+async def get_openai_client(request: Request) -> AsyncOpenAI:
+    """Return the shared OpenAI client instance.
 
     Returns:
         AsyncOpenAI: Configured OpenAI client instance.
 
     """
-    settings = get_settings()
-    return AsyncOpenAI(api_key=settings.openai_api_key)
+    return request.app.state.openai_client
 
 
-@lru_cache
-def get_reasoning_model() -> OpenAIModel:
-    """Create and cache an OpenAI model instance.
+async def get_reasoning_model(request: Request) -> OpenAIModel:
+    """Return the shared OpenAI model instance.
 
     Returns:
         OpenAIModel: Configured OpenAI model instance.
 
     """
-    settings = get_settings()
-    return OpenAIModel(
-        settings.reasoning_model, base_url=settings.openrouter_base_url, api_key=settings.openrouter_api_key
-    )
+    return request.app.state.reasoning_model
 
 
-@lru_cache
-def get_db_session_manager() -> DatabaseSessionManager:
+async def get_db_session_manager(request: Request) -> DatabaseSessionManager:
     """Centralized session manager instance."""
-    settings = get_settings()
-    return DatabaseSessionManager(settings.database_url, {"pool_pre_ping": True, "pool_size": 20, "max_overflow": 10})
+    return request.app.state.db_session_manager
 
 
-@lru_cache
-def get_user_repository(
-    db_session_manager: Annotated[DatabaseSessionManager, Depends(get_db_session_manager)],
-) -> UserRepository:
+async def get_user_repository(request: Request) -> UserRepository:
     """Dependency provider for the UserRepository."""
-    return UserRepository(db_session_manager)
+    return request.app.state.user_repository
 
 
-@lru_cache
-def get_credit_repository(
-    db_session_manager: Annotated[DatabaseSessionManager, Depends(get_db_session_manager)],
-) -> CreditRepository:
+async def get_credit_repository(request: Request) -> CreditRepository:
     """Dependency provider for the CreditRepository."""
-    return CreditRepository(db_session_manager)
+    return request.app.state.credit_repository
 
 
-@lru_cache
-def get_credit_service(
-    credit_repo: Annotated[CreditRepository, Depends(get_credit_repository)],
-) -> CreditService:
+async def get_credit_service(request: Request) -> CreditService:
     """Dependency provider for the CreditService."""
-    return CreditService(credit_repo)
+    return request.app.state.credit_service
 
 
-@lru_cache
-def get_billing_repository(
-    db_session_manager: Annotated[DatabaseSessionManager, Depends(get_db_session_manager)],
-) -> BillingRepository:
+async def get_billing_repository(request: Request) -> BillingRepository:
     """Dependency provider for the BillingRepository."""
-    return BillingRepository(db_session_manager)
+    return request.app.state.billing_repository
 
 
-@lru_cache
-def get_billing_service(
-    billing_repo: Annotated[BillingRepository, Depends(get_billing_repository)],
-) -> BillingService:
+async def get_billing_service(request: Request) -> BillingService:
     """Dependency provider for the BillingService."""
-    return BillingService(billing_repo)
+    return request.app.state.billing_service
 
 
-@lru_cache
-def get_payment_service(
-    credit_repo: Annotated[CreditRepository, Depends(get_credit_repository)],
-    billing_service: Annotated[BillingService, Depends(get_billing_service)],
-) -> PaymentService:
+async def get_payment_service(request: Request) -> PaymentService:
     """Dependency provider for the PaymentService."""
-    return PaymentService(credit_repo, billing_service)
+    return request.app.state.payment_service
 
 
-@lru_cache
-def get_clerk_sync_service(
-    user_repo: Annotated[UserRepository, Depends(get_user_repository)],
-    credit_repo: Annotated[CreditRepository, Depends(get_credit_repository)],
-) -> ClerkUserSyncService:
-    """Dependency provider for the CreditRepository."""
-    return ClerkUserSyncService(user_repo, credit_repo)
+async def get_clerk_sync_service(request: Request) -> ClerkUserSyncService:
+    """Dependency provider for the ClerkUserSyncService."""
+    return request.app.state.clerk_sync_service
 
 
-@lru_cache
-def get_investor_finder() -> InvestorFinder:
-    """Dependency provider for the InvestorFinder service.
+async def get_clerk_webhook_queue(request: Request) -> ClerkWebhookQueue:
+    """Dependency provider for the ClerkWebhookQueue."""
+    return request.app.state.clerk_webhook_queue
 
-    This function creates and caches an instance of InvestorFinder with the necessary
-    configuration from application settings. The caching ensures we don't create
-    unnecessary instances of the service.
+
+async def get_investor_finder(request: Request) -> InvestorFinder:
+    """Dependency provider for the InvestorFinder service.
 
     Returns:
-        InvestorFinder: A configured instance of the InvestorFinder service.
+        InvestorFinder: The shared, pre-configured InvestorFinder service.
 
     """
-    settings = get_settings()
-    openai = get_openai_client()
-    reasoning_model = get_reasoning_model()
-    return InvestorFinder(
-        openai_client=openai,
-        reasoning_model=reasoning_model,
-        embedding_model_name=settings.embedding_model,
-        db_session_manager=get_db_session_manager(),
-    )
+    return request.app.state.investor_finder
 
 
-@lru_cache
-def get_investor_oracle() -> InvestorOracle:
+async def get_investor_oracle(request: Request) -> InvestorOracle:
     """Dependency provider for the InvestorOracle service.
 
-    This function creates and caches an instance of InvestorOracle with the necessary
-    dependencies. The caching ensures we don't create unnecessary instances of the service.
-
     Returns:
-        InvestorOracle: A configured instance of the InvestorOracle service.
+        InvestorOracle: The shared, pre-configured InvestorOracle service.
 
     """
-    investor_finder = get_investor_finder()
-    openai = get_openai_client()
-    return InvestorOracle(
-        investor_finder=investor_finder,
-        openai_client=openai,
-    )
+    return request.app.state.investor_oracle
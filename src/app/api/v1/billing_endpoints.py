@@ -1,20 +1,28 @@
 """API endpoints for managing billing information."""
 
 from typing import Annotated
+from urllib.parse import urlsplit
 from uuid import UUID
 
+import httpx
 from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from loguru import logger
+from starlette.background import BackgroundTask
 
-from app.api.dependencies import get_billing_service
+from app.api.dependencies import get_billing_service, get_http_client
 from app.core.auth.auth import get_current_user
-from app.core.exceptions import BillingOperationError
+from app.core.config import settings
+from app.core.exceptions import BillingConflictError, BillingNotFoundError, BillingOperationError
 from app.models.user import User
 from app.schemas.billing import BillingInfoCreate, BillingInfoResponse, BillingInfoUpdate
 from app.services.billing_service import BillingService
 
 router = APIRouter(prefix="/billing", tags=["billing"])
 
+# Read once at import; the configured list never changes at runtime
+INVOICE_PROXY_HOSTS = frozenset(settings.invoice_proxy_hosts)
+
 
 @router.post("", response_model=BillingInfoResponse)
 async def create_billing_info(
@@ -38,9 +46,9 @@ async def create_billing_info(
     """
     try:
         return await billing_service.create_billing_info(current_user.id, billing_info)
+    except BillingConflictError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
     except BillingOperationError as e:
-        if "already exists" in str(e):
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
         logger.error(f"Error creating billing info: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
 
@@ -50,16 +58,21 @@ async def get_invoice(
     invoice_id: UUID,
     current_user: Annotated[User, Depends(get_current_user)],
     billing_service: Annotated[BillingService, Depends(get_billing_service)],
+    http_client: Annotated[httpx.AsyncClient, Depends(get_http_client)],
 ) -> Response:
     """Get invoice by ID.
 
+    PDFs hosted on one of the configured invoice proxy hosts are streamed through the
+    shared HTTP client, reusing its pooled connections; all others get a redirect.
+
     Args:
         invoice_id: The ID of the invoice to retrieve
         current_user: The authenticated user
         billing_service: Service for managing billing operations
+        http_client: Shared HTTP client used to stream internally hosted PDFs
 
     Returns:
-        The invoice PDF content
+        The invoice PDF content or a redirect to it
 
     Raises:
         HTTPException: If there's an error fetching the invoice
@@ -67,19 +80,40 @@ async def get_invoice(
     """
     try:
         _, invoice_pdf_url = await billing_service.get_invoice(current_user.id, invoice_id)
-        return Response(
-            status_code=status.HTTP_307_TEMPORARY_REDIRECT,
-            headers={"Location": invoice_pdf_url},
-        )
+        if urlsplit(invoice_pdf_url).hostname not in INVOICE_PROXY_HOSTS:
+            return Response(
+                status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+                headers={"Location": invoice_pdf_url},
+            )
+        return await _stream_invoice_pdf(http_client, invoice_pdf_url)
+    except BillingNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     except BillingOperationError as e:
-        if "not found" in str(e):
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
-        if "not available" in str(e):
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
         logger.error(f"Error fetching invoice: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
 
 
+async def _stream_invoice_pdf(http_client: httpx.AsyncClient, invoice_pdf_url: str) -> StreamingResponse:
+    """Stream an invoice PDF from its host, closing the upstream response once sent."""
+    try:
+        upstream = await http_client.send(http_client.build_request("GET", invoice_pdf_url), stream=True)
+    except httpx.HTTPError as e:
+        logger.error(f"Error streaming invoice PDF: {e}")
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Failed to fetch invoice PDF") from e
+
+    if upstream.is_error:
+        await upstream.aclose()
+        logger.error(f"Invoice PDF host responded with status {upstream.status_code}")
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Failed to fetch invoice PDF")
+
+    return StreamingResponse(
+        upstream.aiter_bytes(),
+        media_type="application/pdf",
+        headers={"Cache-Control": "private, max-age=60"},
+        background=BackgroundTask(upstream.aclose),
+    )
+
+
 @router.get("", response_model=BillingInfoResponse)
 async def get_billing_info(
     current_user: Annotated[User, Depends(get_current_user)],
@@ -100,9 +134,9 @@ async def get_billing_info(
     """
     try:
         return await billing_service.get_billing_info(current_user.id)
+    except BillingNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     except BillingOperationError as e:
-        if "not found" in str(e):
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
         logger.error(f"Error fetching billing info: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
 
@@ -129,8 +163,8 @@ async def update_billing_info(
     """
     try:
         return await billing_service.update_billing_info(current_user.id, billing_info)
+    except BillingNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     except BillingOperationError as e:
-        if "not found" in str(e):
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
         logger.error(f"Error updating billing info: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
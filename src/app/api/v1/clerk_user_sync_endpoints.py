@@ -4,77 +4,82 @@ This module handles Clerk webhook endpoints for user lifecycle management,
 including user creation, updates, and deletion through webhook events.
 """
 
+import asyncio
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from loguru import logger
 
-from app.api.dependencies import get_clerk_sync_service
+from app.api.dependencies import get_clerk_webhook_queue
 from app.core.auth.webhooks import verify_webhook_signature
-from app.core.exceptions import UserOperationError
 from app.models.user import ClerkWebhookEvent, WebhookResponse
-from app.services.clerk_user_sync_service import ClerkUserSyncService
+from app.services.clerk_webhook_queue import ClerkWebhookQueue
 
 router = APIRouter()
 
+HANDLED_EVENT_TYPES = frozenset({"user.created", "user.updated", "user.deleted"})
+
 
 @router.post(
     "/clerk-webhooks",
     response_model=WebhookResponse,
-    status_code=status.HTTP_200_OK,
+    status_code=status.HTTP_202_ACCEPTED,
     tags=["auth"],
     include_in_schema=False,
 )
 async def handle_clerk_webhooks(
     request: Request,
-    clerk_user_sync_service: Annotated[ClerkUserSyncService, Depends(get_clerk_sync_service)],
+    clerk_webhook_queue: Annotated[ClerkWebhookQueue, Depends(get_clerk_webhook_queue)],
 ) -> WebhookResponse:
     """Handle Clerk user sync webhooks.
 
-    Processes webhook events from Clerk for user lifecycle management:
+    Verifies the webhook and queues it for background processing, so Clerk gets its
+    acknowledgement without waiting on the database. Clerk does not redeliver an
+    acknowledged event, so events that cannot be applied are stored in
+    failed_clerk_webhooks instead. Queued events are applied in batches for user
+    lifecycle management:
     - user.created: Creates new user record
     - user.updated: Updates existing user information
     - user.deleted: Soft deletes user record
 
     Args:
         request: The incoming webhook request
-        clerk_user_sync_service: Instance of ClerkUserSyncService for managing user synchronization.
+        clerk_webhook_queue: Queue applying the verified events in the background.
 
     Returns:
-        WebhookResponse indicating the operation status
+        WebhookResponse indicating the event was queued, ignored or a duplicate
 
     Raises:
-        HTTPException: For invalid signatures or processing errors
+        HTTPException: For invalid signatures, a saturated queue or processing errors
 
     """
     logger.info("Processing Clerk webhook")
 
     # Verify webhook signature
     await verify_webhook_signature(request)
-    payload = await request.json()
+    # The body is cached by the signature check; validate it straight from bytes without a dict detour
+    body = await request.body()
 
     try:
-        webhook_data = ClerkWebhookEvent(**payload)
-        logger.info(f"Processing Clerk webhook: {webhook_data.type}")
-        if webhook_data.type == "user.created":
-            user_id = await clerk_user_sync_service.sync_new_user(webhook_data)
-            return WebhookResponse(status="created", user_id=str(user_id))
-
-        elif webhook_data.type == "user.updated":
-            await clerk_user_sync_service.sync_update_user(webhook_data)
-            return WebhookResponse(status="updated")
-
-        elif webhook_data.type == "user.deleted":
-            await clerk_user_sync_service.sync_delete_user(webhook_data.data.id)
-            return WebhookResponse(status="deleted")
-
-        else:
+        webhook_data = ClerkWebhookEvent.model_validate_json(body)
+        logger.info(f"Queueing Clerk webhook: {webhook_data.type}")
+        if webhook_data.type not in HANDLED_EVENT_TYPES:
             logger.warning(f"Unhandled webhook event type: {webhook_data.type}")
             return WebhookResponse(status="ignored")
 
-    except UserOperationError as e:
-        logger.error(f"User operation failed: {e}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
+        # Clerk redelivers when our acknowledgement did not reach it; skip those once the original was applied
+        message_id = request.headers.get("svix-id", "")
+        if clerk_webhook_queue.is_applied(message_id):
+            logger.info(f"Skipping replayed Clerk webhook {message_id}")
+            return WebhookResponse(status="duplicate")
+
+        clerk_webhook_queue.enqueue(message_id, webhook_data)
+        return WebhookResponse(status="queued")
+
+    except asyncio.QueueFull as e:
+        # Let Clerk retry the delivery once the backlog has been worked off
+        logger.warning("Clerk webhook queue is full")
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Webhook queue is full") from e
 
     except Exception as e:
         logger.error(f"Webhook processing failed: {e}")
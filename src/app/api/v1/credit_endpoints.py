@@ -1,13 +1,13 @@
 """Endpoint for credits."""
 
-from collections.abc import Sequence
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
 
 from app.api.dependencies import get_credit_service
 from app.core.auth.auth import get_current_user
-from app.core.exceptions import CreditOperationError
+from app.core.exceptions import CreditOperationError, InsufficientCreditsError
 from app.models.user import User
 from app.schemas.credits import (
     CreditBalanceResponse,
@@ -17,39 +17,49 @@ from app.schemas.credits import (
     SpendCreditsResponse,
     TransactionsResponse,
 )
-from app.services.credit_service import CreditService
+from app.services.credit_service import CATALOG_CACHE_TTL_SECONDS, CreditService
 
 router = APIRouter()
 
+# Package listings are public and change rarely, so let clients and proxies reuse them
+CATALOG_CACHE_CONTROL = f"public, max-age={int(CATALOG_CACHE_TTL_SECONDS)}"
+
 
 @router.get("/balance", response_model=CreditBalanceResponse)
 async def get_credit_balance(
     current_user: Annotated[User, Depends(get_current_user)],
     credit_service: Annotated[CreditService, Depends(get_credit_service)],
-) -> CreditBalanceResponse:
+) -> ORJSONResponse:
     """Get the current user's credit balance.
 
+    The balance is returned as a ready-made response, so FastAPI skips re-validating it
+    and the jsonable_encoder pass; response_model only documents the shape.
+
     Args:
         current_user: The authenticated user requesting their balance
         credit_service: Service for managing credit-related operations
 
     """
     try:
-        return await credit_service.get_credit_balance(current_user.id)
+        balance = await credit_service.get_credit_balance(current_user.id)
     except CreditOperationError as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
+    return ORJSONResponse(balance.model_dump(mode="json"))
 
 
 @router.get("/currencies", response_model=list[str])
 async def get_available_currencies(
+    response: Response,
     credit_service: Annotated[CreditService, Depends(get_credit_service)],
 ) -> list[str]:
     """Get list of currencies that have active packages.
 
     Args:
+        response: The outgoing response, used to set caching headers
         credit_service: Service for managing credit-related operations
 
     """
+    response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
     try:
         return await credit_service.get_available_currencies()
     except CreditOperationError as e:
@@ -58,16 +68,19 @@ async def get_available_currencies(
 
 @router.get("/packages", response_model=list[CreditPackageResponse])
 async def get_credit_packages(
+    response: Response,
     credit_service: Annotated[CreditService, Depends(get_credit_service)],
     currency: str | None = None,
-) -> Sequence[CreditPackageResponse]:
+) -> list[CreditPackageResponse]:
     """Get all available credit packages.
 
     Args:
+        response: The outgoing response, used to set caching headers
         credit_service: Service for managing credit-related operations
         currency: Optional currency code to filter packages by (e.g. 'usd', 'eur')
 
     """
+    response.headers["Cache-Control"] = CATALOG_CACHE_CONTROL
     try:
         return await credit_service.get_credit_packages(currency)
     except CreditOperationError as e:
@@ -154,12 +167,12 @@ async def spend_credits(
             user_id=current_user.id,
             amount=request.amount,
         )
+    except InsufficientCreditsError as e:
+        raise HTTPException(
+            status_code=status.HTTP_402_PAYMENT_REQUIRED,
+            detail=str(e),
+        ) from e
     except CreditOperationError as e:
-        if "Insufficient credits" in str(e):
-            raise HTTPException(
-                status_code=status.HTTP_402_PAYMENT_REQUIRED,
-                detail=str(e),
-            ) from e
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e),
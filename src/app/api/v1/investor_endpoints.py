@@ -7,21 +7,42 @@ It defines the core business logic for handling HTTP requests.
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import StreamingResponse
 from loguru import logger
+from pydantic import ValidationError
 
 from app.api.dependencies import get_investor_oracle
 from app.core.auth.auth import verify_token
 from app.schemas.investor import InvestorMatchRequest
+from app.services.investor_oracle import InvestorOracle
 
 router = APIRouter()
 
 
+async def parse_investor_match_request(request: Request) -> InvestorMatchRequest:
+    """Validate the match request straight from the raw body.
+
+    pydantic-core parses the JSON bytes in one pass, instead of FastAPI decoding them into
+    a dict with json.loads first and validating that.
+
+    Raises:
+        RequestValidationError: If the body is not a valid match request, reported like FastAPI's own 422s.
+
+    """
+    try:
+        return InvestorMatchRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        ) from e
+
+
 @router.post("/match", tags=["investors"])
 async def match_investors(
-    request: Request,
-    investor_request: InvestorMatchRequest,
+    investor_request: Annotated[InvestorMatchRequest, Depends(parse_investor_match_request)],
     token_data: Annotated[dict[str, Any], Depends(verify_token)],
+    investor_oracle: Annotated[InvestorOracle, Depends(get_investor_oracle)],
 ) -> StreamingResponse:
     """Stream investor matches based on search criteria.
 
@@ -30,10 +51,10 @@ async def match_investors(
     reasoning for the match.
 
     Args:
-        request: The raw FastAPI request object.
         investor_request (InvestorMatchRequest): The investor match request containing search criteria
         and company context.
         token_data (dict[str, Any]): The decoded JWT token data containing user information.
+        investor_oracle (InvestorOracle): The shared investor oracle service.
 
     Returns:
         StreamingResponse: Server-sent events stream of investor matches.
@@ -73,14 +94,5 @@ async def match_investors(
 
     """
     # user = user or Depends(verify_token)
-    body = await request.body()
-    logger.debug(f"Raw request body: {body.decode()}")
-
-    logger.debug("Token data contents:")
-    for key, value in token_data.items():
-        logger.debug(f"  {key}: {value}")
-
-    user_id = token_data.get("sub")
-    logger.debug(f"User ID from token: {user_id}")
-    investor_oracle = get_investor_oracle()
+    logger.opt(lazy=True).debug("User ID from token: {}", lambda: token_data.get("sub"))
     return await investor_oracle.process_request(request=investor_request)
@@ -15,6 +15,9 @@ from app.services.payment_service import PaymentService, StripeEvent
 
 router = APIRouter()
 
+# Settings are loaded once at import, so the secret is read here rather than on every webhook
+STRIPE_WEBHOOK_SECRET = settings.stripe_webhook_secret
+
 
 @router.post("/create-intent", response_model=PaymentIntentResponse)
 async def create_payment_intent(
@@ -36,7 +39,7 @@ async def stripe_webhook(
     payment_service: Annotated[PaymentService, Depends(get_payment_service)],
 ) -> dict[str, bool]:
     """Handle Stripe webhook events."""
-    if not settings.stripe_webhook_secret:
+    if not STRIPE_WEBHOOK_SECRET:
         raise HTTPException(status_code=500, detail="Stripe webhook secret not configured")
 
     # Get the webhook signature
@@ -51,9 +54,9 @@ async def stripe_webhook(
 
         # Verify webhook signature and construct the event
         raw_event = stripe.Webhook.construct_event(  # type: ignore
-            payload=body.decode("utf-8"),  # Stripe expects the payload as a string
+            payload=body,  # Verified as received; Stripe accepts bytes as well as str
             sig_header=signature,
-            secret=settings.stripe_webhook_secret,
+            secret=STRIPE_WEBHOOK_SECRET,
         )
         event = cast(StripeEvent, raw_event)
 
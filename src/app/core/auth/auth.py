@@ -1,31 +1,122 @@
 """Authentication utilities for verifying JWT tokens."""
 
+import contextlib
+import hashlib
+import time
 from datetime import datetime
+from functools import partial
 from typing import Annotated, Any
 
 import jwt
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from cachetools import TLRUCache, TTLCache
+from cryptography.hazmat.primitives.asymmetric.types import PublicKeyTypes
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import HTTPBearer
+from jwt.utils import base64url_encode
 from loguru import logger
-from sqlalchemy import select
 
-from app.api.dependencies import get_credit_repository, get_db_session_manager, get_user_repository
+from app.api.dependencies import get_clerk_sync_service, get_user_repository
 from app.core.config import settings
-from app.core.database import DatabaseSessionManager
 from app.core.exceptions import UserOperationError
 from app.models.user import ClerkWebhookEvent, User  # type: ignore
-from app.repositories.credit_repository import CreditRepository
 from app.repositories.user_repository import UserRepository
 from app.services.clerk_user_sync_service import ClerkUserSyncService
 
-security = HTTPBearer()
 
+class BearerToken(HTTPBearer):
+    """HTTP bearer scheme that hands dependents the raw token string.
 
-async def verify_token(credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]) -> dict[str, Any]:
+    Keeps HTTPBearer's OpenAPI security scheme and error responses, but skips building an
+    HTTPAuthorizationCredentials model on every request.
+    """
+
+    async def __call__(self, request: Request) -> str:  # type: ignore
+        """Extract the bearer token from the Authorization header.
+
+        Returns:
+            str: The token without its scheme.
+
+        Raises:
+            HTTPException: If the header is missing or does not carry a bearer token.
+
+        """
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if not (scheme and token):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authenticated")
+        if scheme.lower() != "bearer":
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid authentication credentials")
+        return token
+
+
+security = BearerToken(scheme_name="HTTPBearer")
+
+# Verified token payloads are reused for repeat requests with the same bearer token, but
+# never beyond this many seconds or the token's own expiry, whichever comes first
+TOKEN_CACHE_TTL_SECONDS = 30
+
+
+def _token_cache_expiry(_token_hash: str, payload: dict[str, Any], now: float) -> float:
+    """Return the wall-clock time at which a cached token payload must be verified again."""
+    return min(now + TOKEN_CACHE_TTL_SECONDS, payload.get("exp", now))
+
+
+_verified_tokens: TLRUCache[str, dict[str, Any]] = TLRUCache(maxsize=10_000, ttu=_token_cache_expiry, timer=time.time)
+
+# Rejections of expired or forged tokens are final, so a client replaying the same bad token
+# gets the cached 401 instead of another signature check
+REJECTED_TOKEN_CACHE_TTL_SECONDS = 60
+_rejected_tokens: TTLCache[str, str] = TTLCache(maxsize=10_000, ttl=REJECTED_TOKEN_CACHE_TTL_SECONDS)
+
+
+def load_clerk_public_key() -> PublicKeyTypes:
+    """Parse the configured Clerk public key into a key object.
+
+    Called once at startup, so token verification does not rebuild and re-parse
+    the PEM on every request.
+
+    Returns:
+        PublicKeyTypes: The public key used to verify Clerk session tokens.
+
+    """
+    pem = f"-----BEGIN PUBLIC KEY-----\n{settings.clerk_pem_public_key}\n-----END PUBLIC KEY-----"
+    return load_pem_public_key(pem.encode())
+
+
+def warm_up_token_verification(public_key: PublicKeyTypes) -> None:
+    """Run one throwaway RS256 verification against the Clerk public key.
+
+    The first verification in a process pays for PyJWT's algorithm lookup and for
+    initializing the RSA verification path. Doing it at startup keeps that cost off the
+    first authenticated request.
+
+    Args:
+        public_key: The key returned by load_clerk_public_key.
+
+    """
+    # A well-formed token with a blank signature, which always fails verification
+    dummy_token = b".".join(
+        (base64url_encode(b'{"alg":"RS256","typ":"JWT"}'), base64url_encode(b"{}"), base64url_encode(bytes(256)))
+    )
+    with contextlib.suppress(jwt.InvalidTokenError):
+        jwt.decode(dummy_token, key=public_key, algorithms=["RS256"])
+
+
+async def verify_token(
+    request: Request,
+    token: Annotated[str, Depends(security)],
+) -> dict[str, Any]:
     """Verify Clerk JWT token and return payload.
 
+    Payloads of recently verified tokens, and the reason recently rejected tokens failed,
+    are served from in-process caches keyed by the token's hash, skipping the RSA signature
+    check for repeat requests. On a miss the CPU-bound check runs in the threadpool, so it
+    does not stall the event loop.
+
     Args:
-        credentials: The bearer token credentials
+        request: The incoming request, whose app state holds the Clerk public key
+        token: The bearer token
 
     Returns:
         Dict: The decoded token payload with user information
@@ -34,36 +125,52 @@ async def verify_token(credentials: Annotated[HTTPAuthorizationCredentials, Depe
         HTTPException: If token is invalid or expired
 
     """
-    try:
-        raw_key = settings.clerk_pem_public_key
-        public_key = f"-----BEGIN PUBLIC KEY-----\n{raw_key}\n-----END PUBLIC KEY-----"
+    token_hash = hashlib.sha256(token.encode()).hexdigest()[:32]
+    cached_payload = _verified_tokens.get(token_hash)
+    if cached_payload is not None:
+        return cached_payload
+    rejection = _rejected_tokens.get(token_hash)
+    if rejection is not None:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=rejection)
 
-        logger.debug(f"Public key format: {public_key[:50]}...")
-        logger.debug(f"Public key format: {settings.clerk_pem_public_key[:100]}...")
-        payload = jwt.decode(credentials.credentials, key=public_key, algorithms=["RS256"])
-        return payload
+    try:
+        payload = await run_in_threadpool(
+            partial(jwt.decode, token, key=request.app.state.clerk_public_key, algorithms=["RS256"])
+        )
     except jwt.ExpiredSignatureError as e:
+        _rejected_tokens[token_hash] = "Token has expired"
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token has expired") from e
+    except jwt.ImmatureSignatureError as e:
+        # Not valid yet, but will be shortly; not worth remembering
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from e
     except jwt.InvalidTokenError as e:
+        _rejected_tokens[token_hash] = "Invalid token"
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from e
 
+    _verified_tokens[token_hash] = payload
+    return payload
+
 
 async def get_current_user(
-    token_payload: Annotated[dict[str, Any], Depends(verify_token)],
-    db: Annotated[DatabaseSessionManager, Depends(get_db_session_manager)],
+    request: Request,
+    token: Annotated[str, Depends(security)],
     user_repo: Annotated[UserRepository, Depends(get_user_repository)],
-    credit_repo: Annotated[CreditRepository, Depends(get_credit_repository)],
+    user_sync_service: Annotated[ClerkUserSyncService, Depends(get_clerk_sync_service)],
 ) -> User:
     """Get the current authenticated user.
 
     If the user exists in Clerk (valid JWT) but not in our database,
     creates the user using the same logic as the webhook handler.
 
+    The resolved user is cached on the request state, so any further resolution
+    within the same request returns it without verifying the token or querying
+    the database again.
+
     Args:
-        token_payload: The decoded JWT token payload
-        db: Database session manager
-        user_repo: User repository
-        credit_repo: Credit repository
+        request: The incoming request, whose state holds the cached user
+        token: The bearer token
+        user_repo: User repository, caching users by Clerk ID
+        user_sync_service: Service creating users missing from our database
 
     Returns:
         User: The current authenticated user
@@ -72,6 +179,11 @@ async def get_current_user(
         HTTPException: If user is not found or creation fails
 
     """
+    cached_user: User | None = getattr(request.state, "current_user", None)
+    if cached_user is not None:
+        return cached_user
+
+    token_payload = await verify_token(request, token)
     try:
         clerk_id = token_payload.get("sub")
         if not clerk_id:
@@ -80,31 +192,30 @@ async def get_current_user(
                 detail="Invalid authentication credentials",
             )
 
-        async with db.session() as session:
-            result = await session.execute(select(User).where(User.clerk_id == clerk_id))
-            user = result.scalar_one_or_none()
+        # Served from the repository's short-lived cache for users seen recently
+        user = await user_repo.get_user_by_clerk_id(clerk_id)
 
-            if user is None:
-                # User exists in Clerk but not in our database
-                # Create user using the same logic as webhook handler
-                user_sync_service = ClerkUserSyncService(user_repo, credit_repo)
-
-                # Fetch user data from Clerk API
-                clerk_user = await user_sync_service.get_clerk_user(clerk_id)
+        if user is None:
+            # User exists in Clerk but not in our database
+            # Create user using the same logic as webhook handler
+            # Fetch user data from Clerk API
+            clerk_user = await user_sync_service.get_clerk_user(clerk_id)
 
-                # Create webhook event
-                webhook_event = ClerkWebhookEvent(
-                    data=clerk_user, object="user", type="user.created", timestamp=int(datetime.now().timestamp())
-                )
+            # Create webhook event
+            webhook_event = ClerkWebhookEvent(
+                data=clerk_user, object="user", type="user.created", timestamp=int(datetime.now().timestamp())
+            )
 
-                # Create user with same logic as webhook
-                user_id = await user_sync_service.sync_new_user(webhook_event)
+            # Create user with same logic as webhook
+            await user_sync_service.sync_new_user(webhook_event)
 
-                # Fetch the newly created user
-                result = await session.execute(select(User).where(User.id == user_id))
-                user = result.scalar_one()
+            # A newly inserted user is already in the repository cache; only a reactivated one is read back
+            user = await user_repo.get_user_by_clerk_id(clerk_id)
+            if user is None:
+                raise UserOperationError(f"User {clerk_id} not found after creation")
 
-            return user
+        request.state.current_user = user
+        return user
     except UserOperationError as e:
         logger.error(f"Failed to create user: {e}")
         raise HTTPException(
@@ -6,9 +6,10 @@ provides type-safe access to configuration values.
 """
 
 from functools import lru_cache
+from typing import Annotated
 
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -36,16 +37,42 @@ class Settings(BaseSettings):
     stripe_secret_key: str = Field(default=...)
     stripe_webhook_secret: str = Field(default=...)
 
+    # Database connection pool tuning, overridable per environment. Rule of thumb:
+    # db_pool_size >= expected concurrent DB-bound requests per worker x 1.2
+    db_pool_size: int = Field(default=40)
+    db_max_overflow: int = Field(default=20)
+    db_pool_pre_ping: bool = Field(default=False)
+    db_pool_recycle: int = Field(default=1800)
+    db_pool_timeout: int = Field(default=30)
+    db_tcp_keepalives_idle: int = Field(default=60)
+    db_command_timeout: int = Field(default=60)
+    # Compiled statements kept per engine; sized above the distinct statements the repositories issue
+    db_query_cache_size: int = Field(default=1200)
+
+    # Comma-separated hosts whose invoice PDFs are streamed through the API instead of redirected to,
+    # for storage reachable over the internal network; empty keeps the redirect for every host.
+    # NoDecode hands the raw string to the validator instead of parsing it as JSON
+    invoice_proxy_hosts: Annotated[tuple[str, ...], NoDecode] = Field(default=())
+
     @field_validator("allowed_hosts")
     @classmethod
-    def parse_allowed_hosts(cls, v: str) -> list[str]:
+    def parse_allowed_hosts(cls, v: str) -> tuple[str, ...]:
         """Parse allowed hosts env variable."""
         if v == "*":
-            return ["*"]
-        return [host.strip() for host in v.split(",")]
+            return ("*",)
+        return tuple(host.strip() for host in v.split(","))
+
+    @field_validator("invoice_proxy_hosts", mode="before")
+    @classmethod
+    def parse_invoice_proxy_hosts(cls, v: str | tuple[str, ...]) -> tuple[str, ...]:
+        """Parse invoice proxy hosts env variable."""
+        if isinstance(v, str):
+            return tuple(host.strip() for host in v.split(",") if host.strip())
+        return v
 
+    # Frozen: settings are read once per process and shared, so nothing may change them at runtime
     model_config = SettingsConfigDict(
-        env_file=".env", case_sensitive=False, env_nested_delimiter="__", env_prefix="", extra="ignore"
+        env_file=".env", case_sensitive=False, env_nested_delimiter="__", env_prefix="", extra="ignore", frozen=True
     )
 
 
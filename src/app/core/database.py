@@ -1,10 +1,10 @@
 """Database configuration and session management for the application."""
 
+import asyncio
 import contextlib
 from collections.abc import AsyncIterator
 from typing import Any
 
-from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
@@ -13,13 +13,9 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
 
-
-class Base(DeclarativeBase):
-    """Base class for all database models with eager defaults enabled."""
-
-    __mapper_args__: dict[str, Any] = {"eager_defaults": True}  # noqa: RUF012
+# Sent to the driver as-is, skipping SQLAlchemy's statement compilation
+HEALTH_CHECK_QUERY = "SELECT 1"
 
 
 class DatabaseSessionManager:
@@ -71,11 +67,14 @@ class DatabaseSessionManager:
                 await connection.rollback()
                 raise
 
-    @contextlib.asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
-        """Asynchronous context manager for database session.
+    def session(self) -> AsyncSession:
+        """Create a database session, to be used as an async context manager.
 
-        Yields:
+        The session is returned directly rather than wrapped in a generator-based context
+        manager: leaving ``async with`` closes it, which rolls back any transaction that
+        was not committed and returns the connection to the pool.
+
+        Returns:
             AsyncSession: A database session.
 
         Raises:
@@ -85,14 +84,34 @@ class DatabaseSessionManager:
         if self._sessionmaker is None:
             raise SQLAlchemyError("DatabaseSessionManager is not initialized")
 
-        session = self._sessionmaker()
-        try:
-            yield session
-        except SQLAlchemyError:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+        return self._sessionmaker()
+
+    async def warm_up(self, connections: int) -> None:
+        """Open connections concurrently and return them to the pool.
+
+        The first requests after startup then find established connections instead of
+        each paying for a connection handshake.
+
+        Args:
+            connections: Number of connections to open, at most the pool size to keep them all.
+
+        Raises:
+            SQLAlchemyError: If the database engine is not initialized or a connection fails.
+            OSError: If the database server cannot be reached.
+
+        """
+        if self._engine is None:
+            raise SQLAlchemyError("DatabaseSessionManager is not initialized")
+
+        async with contextlib.AsyncExitStack() as stack:
+            # Let every attempt finish before leaving the stack, so none is opened after it closed
+            results = await asyncio.gather(
+                *(stack.enter_async_context(self._engine.connect()) for _ in range(connections)),
+                return_exceptions=True,
+            )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     async def health_check(self) -> bool:
         """Perform a health check on the database connection.
@@ -103,7 +122,7 @@ class DatabaseSessionManager:
         """
         try:
             async with self.connect() as connection:
-                await connection.execute(text("SELECT 1"))
+                await connection.exec_driver_sql(HEALTH_CHECK_QUERY)
             return True
         except SQLAlchemyError:
             return False
@@ -0,0 +1,48 @@
+"""Memoized dependency inspection for FastAPI.
+
+FastAPI re-inspects every dependency callable on every request to decide whether to
+await it, run it in the threadpool or enter it as a context manager. The answer never
+changes for a given callable, so the checks are memoized per callable instead.
+"""
+
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from fastapi.dependencies import utils as dependency_utils
+from loguru import logger
+
+_CHECKS = ("is_coroutine_callable", "is_async_gen_callable", "is_gen_callable")
+
+
+def _memoize(check: Callable[[Callable[..., Any]], bool]) -> Callable[[Callable[..., Any]], bool]:
+    """Wrap an inspection check so each callable is only inspected once."""
+    results: dict[Callable[..., Any], bool] = {}
+
+    @wraps(check)
+    def memoized(call: Callable[..., Any]) -> bool:
+        try:
+            return results[call]
+        except KeyError:
+            result = results[call] = check(call)
+            return result
+        except TypeError:
+            # Unhashable callables are rare; inspect them every time
+            return check(call)
+
+    return memoized
+
+
+def cache_dependency_inspection() -> None:
+    """Replace FastAPI's per-request dependency checks with memoized versions.
+
+    Must be called before the first request is served. Calling it again is a no-op.
+    Checks missing from the installed FastAPI version are skipped and keep working unmemoized.
+    """
+    for name in _CHECKS:
+        check = getattr(dependency_utils, name, None)
+        if check is None:
+            logger.warning(f"FastAPI has no dependency check {name}; leaving it unmemoized")
+            continue
+        if not hasattr(check, "__wrapped__"):
+            setattr(dependency_utils, name, _memoize(check))
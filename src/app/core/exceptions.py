@@ -119,3 +119,21 @@ class BillingOperationError(Exception):
     """Raised when a billing operation fails."""
 
     pass
+
+
+class BillingConflictError(BillingOperationError):
+    """Raised when billing information to be created already exists."""
+
+    pass
+
+
+class BillingNotFoundError(BillingOperationError):
+    """Raised when billing information or an invoice does not exist."""
+
+    pass
+
+
+class InsufficientCreditsError(CreditOperationError):
+    """Raised when a user's balance does not cover the credits to spend."""
+
+    pass
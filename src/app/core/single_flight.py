@@ -0,0 +1,45 @@
+"""Single-flight execution of concurrent identical loads.
+
+When many requests ask for the same data at the same moment, only the first one
+runs the load; the others wait for its result instead of issuing their own query.
+The load runs in its own task, so a caller that gets cancelled does not cancel it
+for the callers still waiting.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+_inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+
+def _finish(key: Hashable, load: asyncio.Future[Any]) -> None:
+    """Forget a finished load, marking its exception as retrieved in case no caller was left waiting."""
+    if _inflight.get(key) is load:
+        del _inflight[key]
+    if not load.cancelled():
+        load.exception()
+
+
+async def run_once[T](key: Hashable, coro_factory: Callable[[], Awaitable[T]]) -> T:
+    """Run the load for key once, sharing its outcome with concurrent callers.
+
+    Args:
+        key: Identifies the load; callers with equal keys share a single execution.
+        coro_factory: Creates the awaitable performing the load. Only called by the
+            first caller for a key.
+
+    Returns:
+        T: The result of the shared load.
+
+    Raises:
+        Exception: Whatever the shared load raised, re-raised to every waiting caller.
+
+    """
+    load = _inflight.get(key)
+    if load is None:
+        load = asyncio.ensure_future(coro_factory())
+        _inflight[key] = load
+        load.add_done_callback(lambda done: _finish(key, done))
+    # Shield the shared load so a cancelled caller does not cancel it for everyone
+    return await asyncio.shield(load)
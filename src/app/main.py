@@ -4,11 +4,56 @@ This module initializes the FastAPI application and configures global settings,
 middleware, and routers. It serves as the entry point for the application.
 """
 
+import os
+import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 import logfire
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import ORJSONResponse
+from loguru import logger
+from sqlalchemy.exc import SQLAlchemyError
 
+from app.api.dependencies import close_services, init_services
 from app.api.v1.router import router as v1_router
+from app.core.auth.auth import load_clerk_public_key, warm_up_token_verification
 from app.core.config import settings
+from app.core.dependency_inspection import cache_dependency_inspection
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build the dependency graph at startup and release it on shutdown.
+
+    Every client, repository and service is constructed once here and stored on
+    ``app.state``, so the first request does not pay for their setup and the
+    dependency providers only read the pre-built instances. The Clerk webhook
+    workers run for the lifetime of the application and are drained on shutdown.
+
+    Args:
+        app: The FastAPI application instance.
+
+    Yields:
+        None: Control back to FastAPI while the application is serving requests.
+
+    """
+    init_services(app)
+    try:
+        await app.state.db_session_manager.warm_up(settings.db_pool_size)
+    except (SQLAlchemyError, OSError) as e:
+        # Start anyway; requests open connections on demand and /ready reports the database state
+        logger.warning(f"Failed to warm up the database connection pool: {e}")
+    app.state.clerk_public_key = load_clerk_public_key()
+    warm_up_token_verification(app.state.clerk_public_key)
+    app.state.clerk_webhook_queue.start()
+    yield
+    await close_services(app)
+    # Flush the records still waiting in the logging queue
+    await logger.complete()
+
+
+cache_dependency_inspection()
 
 app = FastAPI(
     title=settings.app_name,
@@ -18,13 +63,27 @@ app = FastAPI(
     A minimal FastAPI application with proper documentation and structure.
     This API demonstrates best practices for building scalable FastAPI applications.
     """,
-    docs_url="/docs",
-    redoc_url="/redoc",
+    # The interactive docs and the OpenAPI schema behind them are only served in debug mode
+    docs_url="/docs" if settings.debug else None,
+    redoc_url="/redoc" if settings.debug else None,
+    openapi_url="/openapi.json" if settings.debug else None,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.include_router(v1_router, prefix="/api/v1")
 logfire.configure()
 
+# Hand records to a background thread so formatting and stderr writes do not block the event loop
+logger.remove()
+logger.add(
+    sys.stderr,
+    level="DEBUG" if settings.debug else "INFO",
+    enqueue=True,
+    backtrace=False,
+    diagnose=False,
+)
+
 
 @app.get("/health", tags=["system"])
 async def health_check() -> dict[str, str]:
@@ -43,3 +102,42 @@ async def health_check() -> dict[str, str]:
 
     """
     return {"status": "healthy"}
+
+
+@app.get("/ready", tags=["system"])
+async def readiness_check(request: Request, response: Response) -> dict[str, str]:
+    """Check that the application can reach its database.
+
+    Unlike /health, which never leaves the process, this runs a ``SELECT 1`` through
+    the connection pool, so it is meant for readiness probes rather than frequent polling.
+
+    Returns:
+        dict: A dictionary containing the readiness status, with a 503 status code
+        if the database is unreachable.
+
+    Example:
+        Response:
+        ```json
+        {
+            "status": "ready"
+        }
+        ```
+
+    """
+    if not await request.app.state.db_session_manager.health_check():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "unavailable"}
+    return {"status": "ready"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Local entry point mirroring the container command: a single worker, with uvloop and httptools
+    uvicorn.run(
+        "app.main:app",
+        host="127.0.0.1",
+        port=int(os.environ.get("PORT", "8000")),
+        loop="auto",  # uvloop where installed (everywhere but Windows)
+        http="auto",  # httptools where installed
+    )
@@ -14,7 +14,7 @@ from .investors import (
     PortfolioCompany,
     TeamMember,
 )
-from .user import User, UserParams
+from .user import FailedClerkWebhook, User, UserParams
 
 __all__ = [
     "Base",
@@ -22,6 +22,7 @@ __all__ = [
     "CreditConfiguration",
     "CreditPackage",
     "CreditTransaction",
+    "FailedClerkWebhook",
     "FeatureCost",
     "Investor",
     "InvestorChunk",
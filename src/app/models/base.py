@@ -1,18 +1,48 @@
 """Base model configuration for SQLAlchemy models."""
 
-from datetime import datetime
+import os
+import time
+from datetime import UTC, datetime
+from uuid import UUID
 
 from sqlalchemy import DateTime
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 
 
+def utc_now() -> datetime:
+    """Return the current time in UTC, as a client-side column default."""
+    return datetime.now(UTC)
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The leading 48 bits are the Unix time in milliseconds, so consecutive primary keys
+    land next to each other in the B-tree index instead of on random leaf pages.
+
+    Returns:
+        UUID: A new version 7 UUID.
+
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    # Overwrite the version (0b0111) and variant (0b10) bits of the random part
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return UUID(int=value)
+
+
 class Base(DeclarativeBase):
-    """Base class for all SQLAlchemy models."""
+    """Base class for all SQLAlchemy models.
+
+    Timestamps are generated client-side, so inserts and updates need no RETURNING to
+    read them back and can be batched. The server defaults stay for rows written
+    outside the ORM.
+    """
 
     created_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), nullable=True
+        DateTime(timezone=True), default=utc_now, server_default=func.now(), nullable=True
     )
     updated_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=True
+        DateTime(timezone=True), default=utc_now, server_default=func.now(), onupdate=utc_now, nullable=True
     )
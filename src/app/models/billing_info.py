@@ -1,12 +1,12 @@
 """Models for billing information."""
 
 from typing import TYPE_CHECKING
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, uuid7
 
 if TYPE_CHECKING:
     from app.models.user import User
@@ -34,7 +34,7 @@ class BillingInfo(Base):
 
     __tablename__ = "billing_info"
 
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
     user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), unique=True)
     name: Mapped[str] = mapped_column(String(255))
     company_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -45,7 +45,7 @@ class BillingInfo(Base):
     state: Mapped[str | None] = mapped_column(String(100), nullable=True)
     postal_code: Mapped[str] = mapped_column(String(20))
     country: Mapped[str] = mapped_column(String(2))  # ISO 3166-1 alpha-2 country code
-    stripe_customer_id: Mapped[str | None] = mapped_column(String(255), nullable=True, unique=True)
+    stripe_customer_id: Mapped[str | None] = mapped_column(String(255), nullable=True, unique=True, index=True)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="billing_info")
@@ -3,13 +3,13 @@
 from datetime import datetime
 from enum import Enum
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from .base import Base
+from .base import Base, utc_now, uuid7
 from .user import User
 
 
@@ -26,7 +26,7 @@ class FeatureCost(Base):
 
     __tablename__ = "feature_costs"
 
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
     feature_key: Mapped[str] = mapped_column(String(100), unique=True)
     name: Mapped[str] = mapped_column(String(255))
     credits_cost: Mapped[int] = mapped_column(Integer)
@@ -39,8 +39,12 @@ class CreditPackage(Base):
     """Defines available credit purchase options."""
 
     __tablename__ = "credit_packages"
+    __table_args__ = (
+        UniqueConstraint("name", "currency", name="uq_credit_packages_name_currency"),
+        Index("ix_credit_packages_active_currency_credits", "currency", "credits", postgresql_where=text("is_active")),
+    )
 
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255))
     credits: Mapped[int] = mapped_column(Integer)
     price_cents: Mapped[int] = mapped_column(Integer)
@@ -54,13 +58,19 @@ class CreditTransaction(Base):
     """Records all credit-related activities."""
 
     __tablename__ = "credit_transactions"
+    __table_args__ = (
+        Index("ix_credit_transactions_user_created", "user_id", text("created_at DESC")),
+        Index("ix_credit_transactions_user_type_created", "user_id", "transaction_type", "created_at"),
+    )
 
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
     user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
     amount: Mapped[int] = mapped_column(Integer)
     balance_after: Mapped[int] = mapped_column(Integer)
     transaction_type: Mapped[TransactionType] = mapped_column(String(50))
-    feature_key: Mapped[str | None] = mapped_column(ForeignKey("feature_costs.feature_key", ondelete="SET NULL"))
+    feature_key: Mapped[str | None] = mapped_column(
+        ForeignKey("feature_costs.feature_key", ondelete="SET NULL"), index=True
+    )
     description: Mapped[str | None] = mapped_column(Text)
     transaction_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSONB)
 
@@ -79,7 +89,7 @@ class CreditBalance(Base):
     lifetime_credits: Mapped[int] = mapped_column(Integer, default=0)
     tier: Mapped[str] = mapped_column(String(50), default="basic")
     updated_at: Mapped[datetime | None] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), default=utc_now, server_default=func.now(), onupdate=utc_now
     )
 
     user = relationship("User", back_populates="credit_balance")
@@ -105,11 +115,11 @@ class Invoice(Base):
 
     __tablename__ = "credit_invoices"
 
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
-    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
-    transaction_id: Mapped[UUID] = mapped_column(ForeignKey("credit_transactions.id", ondelete="CASCADE"))
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    transaction_id: Mapped[UUID] = mapped_column(ForeignKey("credit_transactions.id", ondelete="CASCADE"), index=True)
     stripe_invoice_id: Mapped[str] = mapped_column(String(255), unique=True)
-    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=func.now())
+    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), default=utc_now)
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="invoices")
@@ -51,7 +51,9 @@ class TeamMember(Base):
     __tablename__ = "team_members"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
-    investor_id: Mapped[int | None] = mapped_column(BigInteger, ForeignKey("investors.id", ondelete="CASCADE"))
+    investor_id: Mapped[int | None] = mapped_column(
+        BigInteger, ForeignKey("investors.id", ondelete="CASCADE"), index=True
+    )
     name: Mapped[str] = mapped_column(Text, nullable=False)
     role: Mapped[str | None] = mapped_column(Text)
     linkedin_url: Mapped[str | None] = mapped_column(Text)
@@ -66,7 +68,9 @@ class PortfolioCompany(Base):
     __tablename__ = "portfolio_companies"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
-    investor_id: Mapped[int | None] = mapped_column(BigInteger, ForeignKey("investors.id", ondelete="CASCADE"))
+    investor_id: Mapped[int | None] = mapped_column(
+        BigInteger, ForeignKey("investors.id", ondelete="CASCADE"), index=True
+    )
     name: Mapped[str] = mapped_column(Text, nullable=False)
     website: Mapped[str | None] = mapped_column(Text)
     industry: Mapped[str | None] = mapped_column(Text)
@@ -82,7 +86,9 @@ class InvestorChunk(Base):
     __tablename__ = "investor_chunks"
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
-    investor_id: Mapped[int | None] = mapped_column(BigInteger, ForeignKey("investors.id", ondelete="CASCADE"))
+    investor_id: Mapped[int | None] = mapped_column(
+        BigInteger, ForeignKey("investors.id", ondelete="CASCADE"), index=True
+    )
     chunk_type: Mapped[str | None] = mapped_column(Text)
     chunk_text: Mapped[str] = mapped_column(Text, nullable=False)
     embedding: Mapped[list[float] | None] = mapped_column(Vector(1536))  # Specified vector size
@@ -95,8 +101,9 @@ class InvestorChunk(Base):
         Index(
             "investor_chunks_embedding_idx",
             "embedding",
-            postgresql_using="ivfflat",
-            postgresql_with={"lists": 100},
-            postgresql_ops={"embedding": "vector_cosine_ops"},
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            # OpenAI embeddings are unit length, so inner product equals cosine similarity
+            postgresql_ops={"embedding": "vector_ip_ops"},
         ),
     )
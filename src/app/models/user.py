@@ -5,14 +5,15 @@ and user data synchronization between Clerk and our application.
 """
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
-from uuid import UUID, uuid4
+from typing import TYPE_CHECKING, Any, Optional
+from uuid import UUID
 
-from pydantic import BaseModel, Field
-from sqlalchemy import DateTime, String
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import DateTime, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base
+from app.models.base import Base, uuid7
 
 if TYPE_CHECKING:
     from app.models.billing_info import BillingInfo
@@ -34,7 +35,7 @@ class User(Base):
 
     __tablename__ = "users"
 
-    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255))
     clerk_id: Mapped[str] = mapped_column(String(255), unique=True, index=True)
     email: Mapped[str] = mapped_column(String(255), index=True)
@@ -51,6 +52,33 @@ class User(Base):
     billing_info: Mapped[Optional["BillingInfo"]] = relationship("BillingInfo", back_populates="user", uselist=False)
 
 
+class FailedClerkWebhook(Base):
+    """Clerk webhook event that could not be applied.
+
+    Webhooks are acknowledged before they are applied, so Clerk never redelivers one
+    that fails later. Events that still fail after the webhook queue's retries are kept
+    here so they can be re-applied.
+
+    Attributes:
+        id: Primary key UUID
+        message_id: Svix message ID of the delivery
+        event_type: Clerk event type (e.g. "user.updated")
+        clerk_id: Clerk ID of the user the event is about
+        payload: The webhook event as received
+        error: Why the event could not be applied
+
+    """
+
+    __tablename__ = "failed_clerk_webhooks"
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid7)
+    message_id: Mapped[str] = mapped_column(String(255))
+    event_type: Mapped[str] = mapped_column(String(50))
+    clerk_id: Mapped[str] = mapped_column(String(255), index=True)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB)
+    error: Mapped[str] = mapped_column(Text)
+
+
 class ClerkEmailVerification(BaseModel):
     """Model for Clerk email verification status.
 
@@ -62,6 +90,8 @@ class ClerkEmailVerification(BaseModel):
 
     """
 
+    model_config = ConfigDict(frozen=True)
+
     status: str
     strategy: str
     attempts: int | None = None
@@ -71,6 +101,8 @@ class ClerkEmailVerification(BaseModel):
 class LinkedToData(BaseModel):
     """Model for linked authentication data."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     type: str
 
@@ -88,10 +120,12 @@ class ClerkEmailAddress(BaseModel):
 
     """
 
+    model_config = ConfigDict(frozen=True)
+
     email_address: str
     id: str
     verification: ClerkEmailVerification
-    linked_to: list[LinkedToData] = Field(default_factory=list)
+    linked_to: tuple[LinkedToData, ...] = ()
     object: str
     reserved: bool | None = None
 
@@ -110,12 +144,23 @@ class ClerkUserData(BaseModel):
     """
 
     id: str
-    email_addresses: list[ClerkEmailAddress] = Field(default_factory=list)
+    email_addresses: tuple[ClerkEmailAddress, ...] = ()
     first_name: str | None = None
     last_name: str | None = None
     primary_email_address_id: str | None = None
     deleted: bool | None = None
 
+    def primary_email_address(self) -> ClerkEmailAddress | None:
+        """Return the user's primary email address, if it is among the email addresses.
+
+        A plain scan: users have a handful of addresses at most, and each event looks the
+        primary up once, so building an index would cost more than it saves.
+        """
+        for email_address in self.email_addresses:
+            if email_address.id == self.primary_email_address_id:
+                return email_address
+        return None
+
 
 class ClerkWebhookEvent(BaseModel):
     """Model for incoming Clerk webhook events.
@@ -128,16 +173,13 @@ class ClerkWebhookEvent(BaseModel):
 
     """
 
+    model_config = ConfigDict(extra="allow")  # Allow additional fields from Clerk
+
     data: ClerkUserData
     type: str
     object: str
     timestamp: int
 
-    class Config:
-        """Additional configuration data."""
-
-        extra = "allow"  # Allow additional fields from Clerk
-
 
 class UserCreate(BaseModel):
     """Model for creating a new user in our database.
@@ -173,7 +215,7 @@ class WebhookResponse(BaseModel):
     """Model for webhook processing response.
 
     Attributes:
-        status: Status of the webhook processing ("created", "updated", "deleted", "ignored")
+        status: Status of the webhook processing ("queued", "ignored", "duplicate")
         user_id: UUID of the affected user (only for user creation)
 
     """
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, lambda_stmt, select
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.database import DatabaseSessionManager
@@ -40,10 +40,10 @@ class BillingRepository:
         """
         try:
             async with self.db_session_manager.session() as session:
-                db_billing_info = BillingInfo(user_id=user_id, **billing_info.model_dump())
-                session.add(db_billing_info)
+                # INSERT ... RETURNING reads the full row back in the same round trip
+                stmt = insert(BillingInfo).values(user_id=user_id, **billing_info.model_dump()).returning(BillingInfo)
+                db_billing_info = (await session.execute(stmt)).scalar_one()
                 await session.commit()
-                await session.refresh(db_billing_info)
                 return db_billing_info
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to create billing info: {e}") from e
@@ -63,7 +63,7 @@ class BillingRepository:
         """
         try:
             async with self.db_session_manager.session() as session:
-                stmt = select(BillingInfo).where(BillingInfo.user_id == user_id)
+                stmt = lambda_stmt(lambda: select(BillingInfo).where(BillingInfo.user_id == user_id))
                 result = await session.execute(stmt)
                 return result.scalar_one_or_none()
         except SQLAlchemyError as e:
@@ -84,7 +84,9 @@ class BillingRepository:
         """
         try:
             async with self.db_session_manager.session() as session:
-                stmt = select(BillingInfo).where(BillingInfo.stripe_customer_id == stripe_customer_id)
+                stmt = lambda_stmt(
+                    lambda: select(BillingInfo).where(BillingInfo.stripe_customer_id == stripe_customer_id)
+                )
                 result = await session.execute(stmt)
                 return result.scalar_one_or_none()
         except SQLAlchemyError as e:
@@ -112,8 +114,9 @@ class BillingRepository:
                 for field, value in update_data.model_dump(exclude_unset=True).items():
                     setattr(billing_info, field, value)
 
+                # merge() loaded every column and timestamps are set client-side, so the
+                # instance is already current without a refresh round trip
                 await session.commit()
-                await session.refresh(billing_info)
                 return billing_info
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to update billing info: {e}") from e
@@ -138,13 +141,14 @@ class BillingRepository:
                 billing_info = await session.merge(billing_info)
 
                 billing_info.stripe_customer_id = stripe_customer_id
+                # merge() loaded every column and timestamps are set client-side, so the
+                # instance is already current without a refresh round trip
                 await session.commit()
-                await session.refresh(billing_info)
                 return billing_info
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to update Stripe customer ID: {e}") from e
 
-    async def get_invoice(self, user_id: UUID, invoice_id: UUID) -> CreditInvoice:
+    async def get_invoice(self, user_id: UUID, invoice_id: UUID) -> CreditInvoice | None:
         """Get invoice by ID and user ID.
 
         Args:
@@ -152,7 +156,7 @@ class BillingRepository:
             invoice_id: The ID of the invoice
 
         Returns:
-            The invoice if found
+            The invoice if found, None otherwise
 
         Raises:
             RepositoryError: If the database operation fails
@@ -160,11 +164,12 @@ class BillingRepository:
         """
         try:
             async with self.db_session_manager.session() as session:
-                stmt = select(CreditInvoice).where(CreditInvoice.id == invoice_id, CreditInvoice.user_id == user_id)
+                stmt = lambda_stmt(
+                    lambda: select(CreditInvoice).where(
+                        CreditInvoice.id == invoice_id, CreditInvoice.user_id == user_id
+                    )
+                )
                 result = await session.execute(stmt)
-                invoice = result.scalar_one_or_none()
-                if not invoice:
-                    raise RepositoryError("Invoice not found")
-                return invoice
+                return result.scalar_one_or_none()
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to fetch invoice: {e}") from e
@@ -1,14 +1,16 @@
 """Module for credit repository."""
 
+import time
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import DateTime, func, insert, lambda_stmt, literal, select, text, update
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from app.core.database import DatabaseSessionManager
 from app.core.exceptions import RepositoryError
+from app.models.base import uuid7
 from app.models.credits import (
     CreditBalance,
     CreditConfiguration,
@@ -18,6 +20,10 @@ from app.models.credits import (
     TransactionType,
 )
 
+# Credit configuration only changes through migrations, so the signup bonus is re-read
+# from the database at most this often
+SIGNUP_BONUS_CACHE_TTL_SECONDS = 60.0
+
 
 class CreditRepository:
     """Repository for credit-related database operations.
@@ -34,9 +40,10 @@ class CreditRepository:
 
         """
         self.db_session_manager = db_session_manager
+        self._signup_bonus_cache: tuple[float, int] | None = None
 
     async def get_signup_bonus(self) -> int:
-        """Get the configured signup bonus amount.
+        """Get the configured signup bonus amount, served from a short-lived cache when possible.
 
         Returns:
             The signup bonus amount.
@@ -45,52 +52,36 @@ class CreditRepository:
             RepositoryError: If the database operation fails.
 
         """
+        cached = self._signup_bonus_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
         try:
             async with self.db_session_manager.session() as session:
-                stmt = select(CreditConfiguration).where(
+                stmt = select(CreditConfiguration.value).where(
                     CreditConfiguration.key == "signup_bonus", CreditConfiguration.is_active
                 )
                 result = await session.execute(stmt)
-                config = result.scalar_one_or_none()
-                return config.value if config else 0
+                signup_bonus = result.scalar_one_or_none() or 0
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to retrieve signup bonus: {e}") from e
 
-    async def create_credit_balance(self, user_id: UUID, balance: int, lifetime_credits: int) -> None:
-        """Create a new credit balance for a user.
-
-        Args:
-            user_id: The ID of the user.
-            balance: The initial credit balance.
-            lifetime_credits: The total lifetime credits for the user.
+        self._signup_bonus_cache = (time.monotonic() + SIGNUP_BONUS_CACHE_TTL_SECONDS, signup_bonus)
+        return signup_bonus
 
-        Raises:
-            RepositoryError: If the database operation fails.
-
-        """
-        try:
-            async with self.db_session_manager.session() as session:
-                credit_balance = CreditBalance(
-                    user_id=user_id,
-                    balance=balance,
-                    lifetime_credits=lifetime_credits,
-                )
-                session.add(credit_balance)
-                await session.commit()
-        except SQLAlchemyError as e:
-            raise RepositoryError(f"Failed to create credit balance: {e}") from e
-
-    async def create_credit_transaction(
-        self, user_id: UUID, amount: int, balance_after: int, transaction_type: TransactionType, description: str
+    async def open_credit_balance(
+        self, user_id: UUID, initial_credits: int, transaction_type: TransactionType, description: str
     ) -> None:
-        """Create a new credit transaction.
+        """Create a user's credit balance together with the transaction recording its initial credits.
+
+        Both rows are written by one data-modifying CTE in a single round trip and
+        transaction, so a balance never exists without the transaction that funded it.
 
         Args:
             user_id: The ID of the user.
-            amount: The amount of the transaction.
-            balance_after: The user's credit balance after the transaction.
-            transaction_type: The type of the transaction.
-            description: A description of the transaction.
+            initial_credits: The starting balance, also counted as lifetime credits.
+            transaction_type: The type of the funding transaction.
+            description: A description of the funding transaction.
 
         Raises:
             RepositoryError: If the database operation fails.
@@ -98,23 +89,41 @@ class CreditRepository:
         """
         try:
             async with self.db_session_manager.session() as session:
-                transaction = CreditTransaction(
-                    user_id=user_id,
-                    amount=amount,
-                    balance_after=balance_after,
-                    transaction_type=transaction_type,
-                    description=description,
+                opened = (
+                    insert(CreditBalance)
+                    # Set explicitly: the columns' client-side defaults cannot be applied inside a CTE
+                    .values(
+                        user_id=user_id,
+                        balance=initial_credits,
+                        lifetime_credits=initial_credits,
+                        tier="basic",
+                        created_at=func.now(),
+                        updated_at=func.now(),
+                    )
+                    .returning(CreditBalance.user_id, CreditBalance.balance)
+                    .cte("opened")
+                )
+                stmt = insert(CreditTransaction).from_select(
+                    ["id", "user_id", "amount", "balance_after", "transaction_type", "description"],
+                    select(
+                        literal(uuid7()),
+                        opened.c.user_id,
+                        literal(initial_credits),
+                        opened.c.balance,
+                        literal(transaction_type.value),
+                        literal(description),
+                    ),
                 )
-                session.add(transaction)
+                await session.execute(stmt)
                 await session.commit()
         except SQLAlchemyError as e:
-            raise RepositoryError(f"Failed to create credit transaction: {e}") from e
+            raise RepositoryError(f"Failed to open credit balance: {e}") from e
 
     async def get_credit_balance(self, user_id: UUID) -> CreditBalance | None:
         """Get the credit balance for a user."""
         try:
             async with self.db_session_manager.session() as session:
-                stmt = select(CreditBalance).where(CreditBalance.user_id == user_id)
+                stmt = lambda_stmt(lambda: select(CreditBalance).where(CreditBalance.user_id == user_id))
                 result = await session.execute(stmt)
                 return result.scalar_one_or_none()
         except SQLAlchemyError as e:
@@ -156,11 +165,8 @@ class CreditRepository:
         """
         try:
             async with self.db_session_manager.session() as session:
-                stmt = (
-                    select(CreditPackage.currency)
-                    .where(CreditPackage.is_active.is_(True))
-                    .group_by(CreditPackage.currency)
-                )
+                # Served by the partial (currency, credits) WHERE is_active index
+                stmt = select(CreditPackage.currency).distinct().where(CreditPackage.is_active.is_(True))
                 result = await session.execute(stmt)
                 return [r[0] for r in result.all()]
         except SQLAlchemyError as e:
@@ -170,7 +176,7 @@ class CreditRepository:
         """Get a credit package by ID."""
         try:
             async with self.db_session_manager.session() as session:
-                stmt = select(CreditPackage).where(CreditPackage.id == package_id)
+                stmt = lambda_stmt(lambda: select(CreditPackage).where(CreditPackage.id == package_id))
                 result = await session.execute(stmt)
                 return result.scalar_one_or_none()
         except SQLAlchemyError as e:
@@ -199,36 +205,93 @@ class CreditRepository:
         """
         try:
             async with self.db_session_manager.session() as session:
-                # Get current balance
-                stmt = select(CreditBalance).where(CreditBalance.user_id == user_id)
-                result = await session.execute(stmt)
-                balance = result.scalar_one_or_none()
+                # Update the balance in place; the row lock taken by the UPDATE serializes
+                # concurrent writers, so no update can be lost between a read and the write
+                stmt = (
+                    update(CreditBalance)
+                    .where(CreditBalance.user_id == user_id)
+                    .values(
+                        balance=CreditBalance.balance + amount,
+                        lifetime_credits=CreditBalance.lifetime_credits + max(amount, 0),
+                    )
+                    .returning(CreditBalance.balance)
+                )
+                new_balance = (await session.execute(stmt)).scalar_one_or_none()
 
-                if not balance:
+                if new_balance is None:
                     raise RepositoryError(f"No credit balance found for user {user_id}")
 
-                # Update balance
-                new_balance = balance.balance + amount
-                balance.balance = new_balance
-                balance.lifetime_credits += amount if amount > 0 else 0
-
-                # Create transaction record
-                transaction = CreditTransaction(
-                    user_id=user_id,
-                    amount=amount,
-                    balance_after=new_balance,
-                    transaction_type=transaction_type,
-                    description=description,
-                    transaction_metadata=transaction_metadata,
+                # Create transaction record, reading the full row back in the same round trip
+                stmt = (
+                    insert(CreditTransaction)
+                    .values(
+                        user_id=user_id,
+                        amount=amount,
+                        balance_after=new_balance,
+                        transaction_type=transaction_type,
+                        description=description,
+                        transaction_metadata=transaction_metadata,
+                    )
+                    .returning(CreditTransaction)
                 )
-                session.add(transaction)
+                transaction = (await session.execute(stmt)).scalar_one()
 
                 await session.commit()
-                await session.refresh(transaction)
                 return transaction
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to add credits: {e}") from e
 
+    async def spend_credits(self, user_id: UUID, amount: int, description: str) -> tuple[int, UUID] | None:
+        """Deduct credits from a user's balance and record the usage in a single statement.
+
+        The balance update and the transaction insert run as one data-modifying CTE, so
+        spending takes a single round trip and cannot overdraw the balance under concurrency.
+
+        Args:
+            user_id: The ID of the user.
+            amount: The amount of credits to spend (positive number).
+            description: A description of the transaction.
+
+        Returns:
+            The balance after spending and the ID of the usage transaction, or None if the
+            user has no balance or it does not cover the amount.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+
+        """
+        try:
+            async with self.db_session_manager.session() as session:
+                spent = (
+                    update(CreditBalance)
+                    .where(CreditBalance.user_id == user_id, CreditBalance.balance >= amount)
+                    # Set explicitly: the column's client-side onupdate cannot be applied inside a CTE
+                    .values(balance=CreditBalance.balance - amount, updated_at=func.now())
+                    .returning(CreditBalance.balance)
+                    .cte("spent")
+                )
+                stmt = (
+                    insert(CreditTransaction)
+                    .from_select(
+                        ["id", "user_id", "amount", "balance_after", "transaction_type", "description"],
+                        select(
+                            literal(uuid7()),
+                            literal(user_id),
+                            literal(-amount),
+                            spent.c.balance,
+                            literal(TransactionType.USAGE.value),
+                            literal(description),
+                        ),
+                    )
+                    .returning(CreditTransaction.balance_after, CreditTransaction.id)
+                )
+                result = await session.execute(stmt)
+                row = result.one_or_none()
+                await session.commit()
+                return (row.balance_after, row.id) if row else None
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Failed to spend credits: {e}") from e
+
     async def get_transactions(
         self,
         user_id: UUID,
@@ -256,7 +319,7 @@ class CreditRepository:
                 # Base query
                 base_query = (
                     select(CreditTransaction)
-                    .options(selectinload(CreditTransaction.invoice))
+                    .options(joinedload(CreditTransaction.invoice))
                     .where(CreditTransaction.user_id == user_id)
                 )
 
@@ -274,16 +337,27 @@ class CreditRepository:
                         )
                     )
 
-                # Get total count
-                count_query = select(func.count()).select_from(base_query.subquery())
-                total_count = await session.execute(count_query)
-                total_count = total_count.scalar_one()
-
-                # Get paginated results
+                # Fetch the page and the total count in one round trip; the window is
+                # evaluated before LIMIT/OFFSET, so every row carries the full count
                 offset = (page - 1) * limit
-                stmt = base_query.order_by(CreditTransaction.created_at.desc()).limit(limit).offset(offset)
+                stmt = (
+                    base_query.add_columns(func.count().over().label("total_count"))
+                    .order_by(CreditTransaction.created_at.desc())
+                    .limit(limit)
+                    .offset(offset)
+                )
                 result = await session.execute(stmt)
-                transactions = list(result.scalars().all())
+                rows = result.all()
+                transactions = [row.CreditTransaction for row in rows]
+
+                if rows:
+                    total_count = rows[0].total_count
+                elif offset:
+                    # A page past the end has no rows to carry the count
+                    count_query = select(func.count()).select_from(base_query.subquery())
+                    total_count = (await session.execute(count_query)).scalar_one()
+                else:
+                    total_count = 0
 
                 return transactions, total_count
         except SQLAlchemyError as e:
@@ -295,15 +369,18 @@ class CreditRepository:
         start_date: datetime,
         end_date: datetime | None = None,
     ) -> list[dict[str, datetime | int]]:
-        """Get daily credit usage data for a user.
+        """Get daily credit usage data for a user, with a data point for every day in the range.
+
+        Days are generated by the database and joined with the per-day usage sums, so days
+        without usage come back with zero credits instead of being left out.
 
         Args:
             user_id: The ID of the user
             start_date: Start date for the usage data
-            end_date: Optional end date for the usage data
+            end_date: Optional end date for the usage data, defaults to now
 
         Returns:
-            List of daily usage data points
+            List of daily usage data points, ordered by date
 
         Raises:
             RepositoryError: If the database operation fails
@@ -314,7 +391,7 @@ class CreditRepository:
                 # Create the date_trunc expression once to reuse
                 date_trunc_expr = func.date_trunc("day", CreditTransaction.created_at).label("date")
 
-                stmt = (
+                usage_stmt = (
                     select(
                         date_trunc_expr,
                         func.sum(CreditTransaction.amount).label("credits"),
@@ -325,11 +402,27 @@ class CreditRepository:
                         CreditTransaction.created_at >= start_date,
                     )
                     .group_by(date_trunc_expr)
-                    .order_by(date_trunc_expr)
                 )
-
                 if end_date:
-                    stmt = stmt.where(CreditTransaction.created_at <= end_date)
+                    usage_stmt = usage_stmt.where(CreditTransaction.created_at <= end_date)
+                usage = usage_stmt.subquery("usage")
+
+                # Typed bounds, as date_trunc and generate_series are overloaded for untyped parameters
+                range_start = literal(start_date, DateTime(timezone=True))
+                range_end = literal(end_date, DateTime(timezone=True)) if end_date else func.now()
+                days = select(
+                    func.generate_series(
+                        func.date_trunc("day", range_start),
+                        func.date_trunc("day", range_end),
+                        text("interval '1 day'"),
+                    ).label("date")
+                ).subquery("days")
+
+                stmt = (
+                    select(days.c.date, func.coalesce(usage.c.credits, 0).label("credits"))
+                    .select_from(days.outerjoin(usage, usage.c.date == days.c.date))
+                    .order_by(days.c.date)
+                )
 
                 result = await session.execute(stmt)
                 return [{"date": row.date, "credits": abs(row.credits)} for row in result.all()]
@@ -358,7 +451,7 @@ class CreditRepository:
         """
         try:
             async with self.db_session_manager.session() as session:
-                stmt = select(func.sum(CreditTransaction.amount)).where(
+                stmt = select(func.coalesce(func.abs(func.sum(CreditTransaction.amount)), 0)).where(
                     CreditTransaction.user_id == user_id,
                     CreditTransaction.transaction_type == "usage",
                     CreditTransaction.created_at >= start_date,
@@ -368,8 +461,7 @@ class CreditRepository:
                     stmt = stmt.where(CreditTransaction.created_at <= end_date)
 
                 result = await session.execute(stmt)
-                usage_sum = result.scalar_one_or_none()
-                return abs(usage_sum) if usage_sum else 0
+                return result.scalar_one()
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to fetch usage sum: {e}") from e
 
@@ -388,13 +480,12 @@ class CreditRepository:
         """
         try:
             async with self.db_session_manager.session() as session:
-                stmt = select(func.sum(CreditTransaction.amount)).where(
+                stmt = select(func.coalesce(func.sum(CreditTransaction.amount), 0)).where(
                     CreditTransaction.user_id == user_id,
                     CreditTransaction.transaction_type == "purchase",
                 )
                 result = await session.execute(stmt)
-                total = result.scalar_one_or_none()
-                return total if total else 0
+                return result.scalar_one()
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to fetch total purchased credits: {e}") from e
 
@@ -414,10 +505,7 @@ class CreditRepository:
         """
         try:
             async with self.db_session_manager.session() as session:
-                stmt = select(Invoice).where(
-                    Invoice.id == invoice_id,
-                    Invoice.user_id == user_id,
-                )
+                stmt = lambda_stmt(lambda: select(Invoice).where(Invoice.id == invoice_id, Invoice.user_id == user_id))
                 result = await session.execute(stmt)
                 return result.scalar_one_or_none()
         except SQLAlchemyError as e:
@@ -451,8 +539,8 @@ class CreditRepository:
                     stripe_invoice_id=stripe_invoice_id,
                 )
                 session.add(invoice)
+                # Every column is set client-side, so the instance needs no refresh round trip
                 await session.commit()
-                await session.refresh(invoice)
                 return invoice
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to create invoice: {e}") from e
@@ -3,12 +3,18 @@
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import select, update
+from cachetools import TTLCache
+from sqlalchemy import bindparam, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.database import DatabaseSessionManager
 from app.core.exceptions import RepositoryError
-from app.models.user import User, UserParams, UserUpdate
+from app.models.user import ClerkWebhookEvent, FailedClerkWebhook, User, UserParams, UserUpdate
+
+# Users looked up by Clerk ID are reused for this long; changes made through this
+# repository evict them immediately, changes from other workers show up after the TTL
+USER_CACHE_TTL_SECONDS = 60
 
 
 class UserRepository:
@@ -26,6 +32,37 @@ class UserRepository:
 
         """
         self.db_session_manager = db_session_manager
+        self._users_by_clerk_id: TTLCache[str, User] = TTLCache(maxsize=5000, ttl=USER_CACHE_TTL_SECONDS)
+
+    async def get_user_by_clerk_id(self, clerk_id: str) -> User | None:
+        """Get a user by Clerk ID, served from a short-lived cache when possible.
+
+        Args:
+            clerk_id: The Clerk ID to search for.
+
+        Returns:
+            The user if found, None otherwise.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+
+        """
+        cached_user = self._users_by_clerk_id.get(clerk_id)
+        if cached_user is not None:
+            return cached_user
+
+        try:
+            async with self.db_session_manager.session() as session:
+                stmt = lambda_stmt(lambda: select(User).where(User.clerk_id == clerk_id))
+                result = await session.execute(stmt)
+                user = result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Failed to get user by Clerk ID: {e}") from e
+
+        # Misses are not cached, so a user created right after is found on the next lookup
+        if user is not None:
+            self._users_by_clerk_id[clerk_id] = user
+        return user
 
     async def get_user_by_email(self, email: str) -> User | None:
         """Get a user by email address, including soft-deleted users.
@@ -42,39 +79,50 @@ class UserRepository:
         """
         try:
             async with self.db_session_manager.session() as session:
-                stmt = select(User).where(User.email == email)
+                stmt = lambda_stmt(lambda: select(User).where(User.email == email))
                 result = await session.execute(stmt)
                 return result.scalar_one_or_none()
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to get user by email: {e}") from e
 
     async def create_user(self, user_params: "UserParams") -> UUID:
-        """Create a new user in the database.
+        """Create a new user in the database, or return the one already holding its Clerk ID.
+
+        The insert and the read-back are a single INSERT ... ON CONFLICT ... RETURNING
+        statement. The returned row is cached, so a lookup by Clerk ID right after
+        creation does not query the database again.
 
         Args:
             user_params: The parameters for creating the user.
 
         Returns:
-            The UUID of the newly created user.
+            The UUID of the stored user. It differs from user_params.uuid if a concurrent
+            sync created the user first.
 
         Raises:
             RepositoryError: If the database operation fails.
 
         """
+        stmt = insert(User).values(
+            id=user_params.uuid,
+            clerk_id=user_params.clerk_id,
+            email=user_params.email,
+            name=user_params.name,
+        )
+        # A no-op update, so RETURNING also yields the existing row on conflict
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[User.clerk_id], set_={"clerk_id": stmt.excluded.clerk_id}
+        ).returning(User)
         try:
             async with self.db_session_manager.session() as session:
-                user = User(
-                    id=user_params.uuid,
-                    clerk_id=user_params.clerk_id,
-                    email=user_params.email,
-                    name=user_params.name,
-                )
-                session.add(user)
+                user = (await session.scalars(stmt)).one()
                 await session.commit()
-                return user.id
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to create user: {e}") from e
 
+        self._users_by_clerk_id[user.clerk_id] = user
+        return user.id
+
     async def update_user(self, clerk_id: str, user_update: UserUpdate) -> None:
         """Update an existing user in the database.
 
@@ -95,6 +143,7 @@ class UserRepository:
                 await session.commit()
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to update user: {e}") from e
+        self._users_by_clerk_id.pop(clerk_id, None)
 
     async def delete_user(self, clerk_id: str) -> None:
         """Mark a user as deleted in the database.
@@ -113,6 +162,7 @@ class UserRepository:
                 await session.commit()
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to delete user: {e}") from e
+        self._users_by_clerk_id.pop(clerk_id, None)
 
     async def reactivate_user(self, user_id: UUID, clerk_id: str, name: str) -> None:
         """Reactivate a soft-deleted user with a new Clerk ID.
@@ -133,3 +183,67 @@ class UserRepository:
                 await session.commit()
         except SQLAlchemyError as e:
             raise RepositoryError(f"Failed to reactivate user: {e}") from e
+        self._users_by_clerk_id.pop(clerk_id, None)
+
+    async def apply_user_changes(self, updates: dict[str, UserUpdate], deleted_clerk_ids: list[str]) -> None:
+        """Apply several user updates and deletions in a single transaction.
+
+        Args:
+            updates: The updated user information, keyed by Clerk ID.
+            deleted_clerk_ids: The Clerk IDs of users to mark as deleted.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+
+        """
+        try:
+            async with self.db_session_manager.session() as session:
+                if updates:
+                    users = User.__table__
+                    stmt = (
+                        update(users)
+                        .where(users.c.clerk_id == bindparam("b_clerk_id"))
+                        .values(email=bindparam("b_email"), name=bindparam("b_name"))
+                    )
+                    await session.execute(
+                        stmt,
+                        [
+                            {"b_clerk_id": clerk_id, "b_email": user_update.email, "b_name": user_update.name}
+                            for clerk_id, user_update in updates.items()
+                        ],
+                    )
+                if deleted_clerk_ids:
+                    stmt = update(User).where(User.clerk_id.in_(deleted_clerk_ids)).values(deleted_at=datetime.now(UTC))
+                    await session.execute(stmt)
+                await session.commit()
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Failed to apply user changes: {e}") from e
+        for clerk_id in [*updates, *deleted_clerk_ids]:
+            self._users_by_clerk_id.pop(clerk_id, None)
+
+    async def record_failed_webhook(self, message_id: str, event: ClerkWebhookEvent, error: str) -> None:
+        """Store a Clerk webhook event that could not be applied, so it can be re-applied later.
+
+        Args:
+            message_id: The Svix message ID of the delivery.
+            event: The webhook event that failed.
+            error: Why the event could not be applied.
+
+        Raises:
+            RepositoryError: If the database operation fails.
+
+        """
+        try:
+            async with self.db_session_manager.session() as session:
+                session.add(
+                    FailedClerkWebhook(
+                        message_id=message_id,
+                        event_type=event.type,
+                        clerk_id=event.data.id,
+                        payload=event.model_dump(mode="json"),
+                        error=error,
+                    )
+                )
+                await session.commit()
+        except SQLAlchemyError as e:
+            raise RepositoryError(f"Failed to record failed Clerk webhook: {e}") from e
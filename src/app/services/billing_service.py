@@ -7,7 +7,13 @@ from loguru import logger
 from stripe import StripeError
 
 from app.core.config import settings
-from app.core.exceptions import BillingOperationError, RepositoryError
+from app.core.exceptions import (
+    BillingConflictError,
+    BillingNotFoundError,
+    BillingOperationError,
+    RepositoryError,
+)
+from app.core.single_flight import run_once
 from app.models.billing_info import BillingInfo
 from app.models.credits import Invoice as CreditInvoice
 from app.repositories.billing_repository import BillingRepository
@@ -32,6 +38,7 @@ class BillingService:
             The created billing information
 
         Raises:
+            BillingConflictError: If the user already has billing info
             BillingOperationError: If there's an error creating the billing info
 
         """
@@ -39,7 +46,7 @@ class BillingService:
             # Check if billing info already exists
             existing_info = await self.billing_repo.get_by_user_id(user_id)
             if existing_info:
-                raise BillingOperationError("Billing information already exists for this user")
+                raise BillingConflictError("Billing information already exists for this user")
 
             # Create new billing info
             db_billing_info = await self.billing_repo.create(user_id, billing_info)
@@ -48,6 +55,8 @@ class BillingService:
         except RepositoryError as e:
             logger.error(f"Repository error while creating billing info: {e}")
             raise BillingOperationError(f"Failed to create billing info: {e}") from e
+        except BillingOperationError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error while creating billing info: {e}")
             raise BillingOperationError(f"Failed to create billing info: {e}") from e
@@ -62,19 +71,23 @@ class BillingService:
             The user's billing information
 
         Raises:
+            BillingNotFoundError: If the user has no billing info
             BillingOperationError: If there's an error fetching the billing info
 
         """
         try:
-            billing_info = await self.billing_repo.get_by_user_id(user_id)
+            # Share one query between concurrent requests for the same user
+            billing_info = await run_once(("billing_info", user_id), lambda: self.billing_repo.get_by_user_id(user_id))
             if not billing_info:
-                raise BillingOperationError("No billing information found for this user")
+                raise BillingNotFoundError("No billing information found for this user")
 
             return BillingInfoResponse.model_validate(billing_info)
 
         except RepositoryError as e:
             logger.error(f"Repository error while fetching billing info: {e}")
             raise BillingOperationError(f"Failed to fetch billing info: {e}") from e
+        except BillingOperationError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error while fetching billing info: {e}")
             raise BillingOperationError(f"Failed to fetch billing info: {e}") from e
@@ -89,19 +102,22 @@ class BillingService:
             The user's billing information model
 
         Raises:
+            BillingNotFoundError: If the user has no billing info
             BillingOperationError: If there's an error fetching the billing info
 
         """
         try:
             billing_info = await self.billing_repo.get_by_user_id(user_id)
             if not billing_info:
-                raise BillingOperationError("No billing information found for this user")
+                raise BillingNotFoundError("No billing information found for this user")
 
             return billing_info
 
         except RepositoryError as e:
             logger.error(f"Repository error while fetching billing info: {e}")
             raise BillingOperationError(f"Failed to fetch billing info: {e}") from e
+        except BillingOperationError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error while fetching billing info: {e}")
             raise BillingOperationError(f"Failed to fetch billing info: {e}") from e
@@ -117,6 +133,7 @@ class BillingService:
             The updated billing information
 
         Raises:
+            BillingNotFoundError: If the user has no billing info
             BillingOperationError: If there's an error updating the billing info
 
         """
@@ -124,7 +141,7 @@ class BillingService:
             # Get existing billing info
             existing_info = await self.billing_repo.get_by_user_id(user_id)
             if not existing_info:
-                raise BillingOperationError("No billing information found for this user")
+                raise BillingNotFoundError("No billing information found for this user")
 
             # Update billing info
             updated_info = await self.billing_repo.update(existing_info, billing_info)
@@ -133,6 +150,8 @@ class BillingService:
         except RepositoryError as e:
             logger.error(f"Repository error while updating billing info: {e}")
             raise BillingOperationError(f"Failed to update billing info: {e}") from e
+        except BillingOperationError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error while updating billing info: {e}")
             raise BillingOperationError(f"Failed to update billing info: {e}") from e
@@ -171,12 +190,15 @@ class BillingService:
             A tuple containing the invoice and the PDF URL
 
         Raises:
+            BillingNotFoundError: If the invoice or its PDF does not exist
             BillingOperationError: If there's an error fetching the invoice
 
         """
         try:
             # Get the invoice from our database to verify ownership
             invoice = await self.billing_repo.get_invoice(user_id, invoice_id)
+            if not invoice:
+                raise BillingNotFoundError("Invoice not found")
 
             try:
                 # Get the invoice from Stripe with PDF URL
@@ -186,10 +208,7 @@ class BillingService:
                 )
 
                 if not stripe_invoice.invoice_pdf:
-                    raise BillingOperationError("Invoice PDF not available")
-
-                if not stripe_invoice.invoice_pdf:
-                    raise BillingOperationError("Invoice PDF not available")
+                    raise BillingNotFoundError("Invoice PDF not available")
 
                 return invoice, stripe_invoice.invoice_pdf
 
@@ -200,6 +219,8 @@ class BillingService:
         except RepositoryError as e:
             logger.error(f"Repository error while fetching invoice: {e}")
             raise BillingOperationError(f"Failed to fetch invoice: {e}") from e
+        except BillingOperationError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error while fetching invoice: {e}")
             raise BillingOperationError(f"Failed to fetch invoice: {e}") from e
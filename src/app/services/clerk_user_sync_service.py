@@ -1,12 +1,14 @@
 """Service for synchronizing user data from Clerk webhooks."""
 
-from uuid import UUID, uuid4
+from collections.abc import Sequence
+from uuid import UUID
 
 import httpx
 from loguru import logger
 
 from app.core.config import settings
 from app.core.exceptions import RepositoryError, UserOperationError
+from app.models.base import uuid7
 from app.models.credits import TransactionType
 from app.models.user import ClerkUserData, ClerkWebhookEvent, UserParams, UserUpdate
 from app.repositories.credit_repository import CreditRepository
@@ -16,11 +18,15 @@ from app.repositories.user_repository import UserRepository
 class ClerkUserSyncService:
     """Service for synchronizing user data from Clerk webhook events."""
 
-    def __init__(self, user_repo: UserRepository, credit_repo: CreditRepository) -> None:
-        """Initialize the service with repositories."""
+    def __init__(
+        self, user_repo: UserRepository, credit_repo: CreditRepository, http_client: httpx.AsyncClient
+    ) -> None:
+        """Initialize the service with repositories and the shared HTTP client."""
         self.user_repo = user_repo
         self.credit_repo = credit_repo
+        self.http_client = http_client
         self.clerk_base_url = settings.clerk_base_url
+        self._clerk_auth_headers = {"Authorization": f"Bearer {settings.clerk_secret_key}"}
 
     async def get_clerk_user(self, clerk_id: str) -> ClerkUserData:
         """Fetch user data from Clerk API.
@@ -36,21 +42,20 @@ class ClerkUserSyncService:
 
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.clerk_base_url}/users/{clerk_id}",
-                    headers={"Authorization": f"Bearer {settings.clerk_secret_key}"},
-                )
-                response.raise_for_status()
-                user_data = response.json()
-
-                return ClerkUserData(
-                    id=user_data["id"],
-                    email_addresses=user_data["email_addresses"],
-                    first_name=user_data.get("first_name"),
-                    last_name=user_data.get("last_name"),
-                    primary_email_address_id=user_data["primary_email_address_id"],
-                )
+            response = await self.http_client.get(
+                f"{self.clerk_base_url}/users/{clerk_id}",
+                headers=self._clerk_auth_headers,
+            )
+            response.raise_for_status()
+            user_data = response.json()
+
+            return ClerkUserData(
+                id=user_data["id"],
+                email_addresses=user_data["email_addresses"],
+                first_name=user_data.get("first_name"),
+                last_name=user_data.get("last_name"),
+                primary_email_address_id=user_data["primary_email_address_id"],
+            )
         except Exception as e:
             logger.error(f"Failed to fetch user data from Clerk: {e}")
             raise UserOperationError(f"Failed to fetch user data from Clerk: {e}") from e
@@ -59,18 +64,8 @@ class ClerkUserSyncService:
         """Create a new user record from Clerk webhook data and initialize credits."""
         try:
             user_data = webhook_data.data
-
-            if not user_data.email_addresses:
-                raise UserOperationError("No email addresses provided")
-
-            email = next(
-                (e.email_address for e in user_data.email_addresses if e.id == user_data.primary_email_address_id),
-                None,
-            )
-            if email is None:
-                raise UserOperationError("Primary email address not found")
-
-            name = f"{user_data.first_name or ''} {user_data.last_name or ''}".strip()
+            user_details = self._user_update_from(user_data)
+            email, name = user_details.email, user_details.name
 
             # Check if user with this email already exists (including soft-deleted)
             existing_user = await self.user_repo.get_user_by_email(email)
@@ -81,7 +76,7 @@ class ClerkUserSyncService:
                 return existing_user.id
 
             # Create new user if no existing user found
-            user_uuid = uuid4()
+            user_uuid = uuid7()
             user_params = UserParams(
                 uuid=user_uuid,
                 clerk_id=user_data.id,
@@ -89,21 +84,19 @@ class ClerkUserSyncService:
                 name=name,
             )
 
-            # Create user
-            await self.user_repo.create_user(user_params)
+            # Create user; if a concurrent sync created it first, it already got its signup bonus
+            stored_user_id = await self.user_repo.create_user(user_params)
+            if stored_user_id != user_uuid:
+                return stored_user_id
 
             # Get signup bonus amount from configuration
             signup_bonus = await self.credit_repo.get_signup_bonus()
 
             if signup_bonus > 0:
-                # Initialize credit balance
-                await self.credit_repo.create_credit_balance(user_params.uuid, signup_bonus, signup_bonus)
-
-                # Record transaction
-                await self.credit_repo.create_credit_transaction(
+                # Initialize credit balance and record its transaction in one go
+                await self.credit_repo.open_credit_balance(
                     user_id=user_params.uuid,
-                    amount=signup_bonus,
-                    balance_after=signup_bonus,
+                    initial_credits=signup_bonus,
                     transaction_type=TransactionType.SIGNUP_BONUS,
                     description="Welcome bonus credits",
                 )
@@ -120,25 +113,10 @@ class ClerkUserSyncService:
     async def sync_update_user(self, webhook_data: ClerkWebhookEvent) -> None:
         """Update an existing user record from Clerk webhook data."""
         try:
-            user_data = webhook_data.data
-
-            if not user_data.email_addresses:
-                raise UserOperationError("No email addresses provided")
-
-            email = next(
-                (e.email_address for e in user_data.email_addresses if e.id == user_data.primary_email_address_id),
-                None,
-            )
-            if email is None:
-                raise UserOperationError("Primary email address not found")
-
-            user_update = UserUpdate(
-                email=email,
-                name=f"{user_data.first_name or ''} {user_data.last_name or ''}".strip(),
-            )
+            user_update = self._user_update_from(webhook_data.data)
 
             # Update user
-            await self.user_repo.update_user(user_data.id, user_update)
+            await self.user_repo.update_user(webhook_data.data.id, user_update)
 
         except RepositoryError as e:
             logger.error(f"Repository error during user update: {e}")
@@ -159,3 +137,85 @@ class ClerkUserSyncService:
         except Exception as e:
             logger.error(f"Unexpected error during user deletion: {e}")
             raise UserOperationError(f"Failed to delete user: {e}") from e
+
+    async def sync_batch(self, events: Sequence[ClerkWebhookEvent]) -> None:
+        """Apply a batch of Clerk webhook events in order.
+
+        Consecutive updates and deletions are collected and written in a single
+        transaction. Creations still go through sync_new_user one by one, since they
+        may reactivate an existing user and grant the signup bonus; pending updates
+        and deletions are flushed first so events for the same user keep their order.
+        Every event type is safe to apply again, so a failed batch can be retried as a whole.
+
+        Args:
+            events: The verified webhook events, in the order they were received.
+
+        Raises:
+            UserOperationError: If any event of the batch could not be applied.
+
+        """
+        updates: dict[str, UserUpdate] = {}
+        deleted_clerk_ids: list[str] = []
+
+        for event in events:
+            if event.type == "user.created":
+                await self._flush_user_changes(updates, deleted_clerk_ids)
+                updates, deleted_clerk_ids = {}, []
+                await self.sync_new_user(event)
+            elif event.type == "user.updated":
+                # A later update of the same user in the batch supersedes an earlier one
+                updates[event.data.id] = self._user_update_from(event.data)
+            elif event.type == "user.deleted":
+                deleted_clerk_ids.append(event.data.id)
+            else:
+                logger.warning(f"Unhandled webhook event type: {event.type}")
+
+        await self._flush_user_changes(updates, deleted_clerk_ids)
+
+    async def _flush_user_changes(self, updates: dict[str, UserUpdate], deleted_clerk_ids: list[str]) -> None:
+        """Write the collected updates and deletions in one transaction.
+
+        Raises:
+            UserOperationError: If the changes could not be written.
+
+        """
+        if not updates and not deleted_clerk_ids:
+            return
+        try:
+            await self.user_repo.apply_user_changes(updates, deleted_clerk_ids)
+        except RepositoryError as e:
+            raise UserOperationError(
+                f"Failed to apply {len(updates)} user updates and {len(deleted_clerk_ids)} user deletions: {e}"
+            ) from e
+
+    async def record_failed_event(self, message_id: str, event: ClerkWebhookEvent, error: str) -> None:
+        """Keep a Clerk webhook event that could not be applied, so it can be re-applied later.
+
+        Raises:
+            UserOperationError: If the event could not be stored.
+
+        """
+        try:
+            await self.user_repo.record_failed_webhook(message_id, event, error)
+        except RepositoryError as e:
+            raise UserOperationError(f"Failed to record failed Clerk webhook {message_id}: {e}") from e
+
+    @staticmethod
+    def _user_update_from(user_data: ClerkUserData) -> UserUpdate:
+        """Build the user update from the Clerk user data of a webhook event.
+
+        Raises:
+            UserOperationError: If the primary email address is missing.
+
+        """
+        if not user_data.email_addresses:
+            raise UserOperationError("No email addresses provided")
+
+        primary_email = user_data.primary_email_address()
+        if primary_email is None:
+            raise UserOperationError("Primary email address not found")
+
+        return UserUpdate(
+            email=primary_email.email_address,
+            name=f"{user_data.first_name or ''} {user_data.last_name or ''}".strip(),
+        )
@@ -0,0 +1,149 @@
+"""Background queue applying verified Clerk webhook events in batches."""
+
+import asyncio
+import contextlib
+
+from cachetools import TTLCache
+from loguru import logger
+
+from app.models.user import ClerkWebhookEvent
+from app.services.clerk_user_sync_service import ClerkUserSyncService
+
+
+class ClerkWebhookQueue:
+    """Buffers verified Clerk webhook events and applies them in batches in the background.
+
+    Events are routed to a worker by Clerk user ID, so all events for the same user are
+    handled by one worker in the order they were received. A failed batch is retried, then
+    applied event by event so a failing event only affects itself.
+
+    Delivery is at most once. Events are acknowledged with 202 before they are applied,
+    and Clerk only redelivers deliveries that were not acknowledged, so it never retries
+    an event that fails here. Events that still fail are stored in failed_clerk_webhooks
+    to be re-applied from there. Events still queued when the process dies are lost.
+
+    The Svix message ID of an event is remembered once it was applied. Clerk redelivers
+    a delivery whose acknowledgement did not reach it, and those replays are skipped.
+    """
+
+    def __init__(
+        self,
+        sync_service: ClerkUserSyncService,
+        workers: int = 4,
+        maxsize: int = 10000,
+        max_batch_size: int = 50,
+        max_batch_delay: float = 0.1,
+        retry_delay: float = 0.5,
+    ) -> None:
+        """Initialize the queue.
+
+        Args:
+            sync_service: Service applying the batched events to the database.
+            workers: Number of background workers.
+            maxsize: Maximum number of events waiting across all workers.
+            max_batch_size: Maximum number of events applied in one batch.
+            max_batch_delay: Seconds a worker waits for more events before applying a batch.
+            retry_delay: Seconds a worker waits before retrying a failed batch.
+
+        """
+        self.sync_service = sync_service
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self.retry_delay = retry_delay
+        # Svix message IDs of recently applied deliveries; Clerk keeps the ID when it retries a delivery
+        self._applied_message_ids: TTLCache[str, bool] = TTLCache(maxsize=10_000, ttl=600)
+        self._queues: list[asyncio.Queue[tuple[str, ClerkWebhookEvent]]] = [
+            asyncio.Queue(maxsize=max(1, maxsize // workers)) for _ in range(workers)
+        ]
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def start(self) -> None:
+        """Start the background workers. Must be called from the running event loop."""
+        self._tasks = [asyncio.create_task(self._worker(queue)) for queue in self._queues]
+
+    async def stop(self) -> None:
+        """Apply the events still waiting, then stop the background workers."""
+        for queue in self._queues:
+            await queue.join()
+        for task in self._tasks:
+            task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await asyncio.gather(*self._tasks)
+        self._tasks = []
+
+    def is_applied(self, message_id: str) -> bool:
+        """Check whether the delivery with this Svix message ID was recently applied."""
+        return message_id in self._applied_message_ids
+
+    def enqueue(self, message_id: str, event: ClerkWebhookEvent) -> None:
+        """Queue an event for background processing.
+
+        Args:
+            message_id: The Svix message ID of the delivery.
+            event: The verified webhook event.
+
+        Raises:
+            asyncio.QueueFull: If the worker responsible for the event's user is saturated.
+
+        """
+        self._queues[hash(event.data.id) % len(self._queues)].put_nowait((message_id, event))
+
+    async def _worker(self, queue: asyncio.Queue[tuple[str, ClerkWebhookEvent]]) -> None:
+        """Collect events into batches and hand them to the sync service."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_batch_delay
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+
+            try:
+                await self._apply_batch(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _apply_batch(self, batch: list[tuple[str, ClerkWebhookEvent]]) -> None:
+        """Apply a batch, retrying it once and then falling back to one event at a time."""
+        events = [event for _, event in batch]
+        try:
+            await self.sync_service.sync_batch(events)
+        except Exception as e:
+            logger.warning(f"Failed to apply batch of {len(batch)} Clerk webhook events, retrying: {e}")
+            await asyncio.sleep(self.retry_delay)
+            try:
+                await self.sync_service.sync_batch(events)
+            except Exception as e:
+                logger.warning(f"Retry of batch of {len(batch)} Clerk webhook events failed, applying one by one: {e}")
+                await self._apply_one_by_one(batch)
+                return
+
+        for message_id, _ in batch:
+            self._applied_message_ids[message_id] = True
+
+    async def _apply_one_by_one(self, batch: list[tuple[str, ClerkWebhookEvent]]) -> None:
+        """Apply the events of a failed batch separately, logging the ones that still fail."""
+        for message_id, event in batch:
+            try:
+                await self.sync_service.sync_batch([event])
+            except Exception as e:
+                logger.error(
+                    f"Failed to apply Clerk webhook {message_id} ({event.type}) for Clerk user {event.data.id}: {e}"
+                )
+                await self._record_failure(message_id, event, e)
+            else:
+                self._applied_message_ids[message_id] = True
+
+    async def _record_failure(self, message_id: str, event: ClerkWebhookEvent, error: Exception) -> None:
+        """Store an event that could not be applied, falling back to logging it in full."""
+        try:
+            await self.sync_service.record_failed_event(message_id, event, str(error))
+        except Exception as e:
+            # The database is likely what failed the event too; the log is all that is left to re-apply it from
+            logger.error(f"Failed to store Clerk webhook {message_id}: {e}; event: {event.model_dump_json()}")
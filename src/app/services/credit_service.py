@@ -1,14 +1,15 @@
 """Service for credits."""
 
-from collections.abc import Sequence
+import time
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 from loguru import logger
 from stripe import StripeError
 
-from app.core.exceptions import CreditOperationError, RepositoryError
-from app.models.credits import Invoice, TransactionType
+from app.core.exceptions import CreditOperationError, InsufficientCreditsError, RepositoryError
+from app.core.single_flight import run_once
+from app.models.credits import Invoice
 from app.repositories.credit_repository import CreditRepository
 from app.schemas.credits import (
     CreditBalanceResponse,
@@ -21,6 +22,10 @@ from app.schemas.credits import (
     TransactionsResponse,
 )
 
+# Package and currency listings change rarely (only through migrations), so they are served
+# from memory for this long before being re-read from the database
+CATALOG_CACHE_TTL_SECONDS = 300.0
+
 
 class CreditService:
     """Service for handling credit-related operations."""
@@ -28,12 +33,17 @@ class CreditService:
     def __init__(self, credit_repo: CreditRepository) -> None:
         """Initialize the service with a credit repository."""
         self.credit_repo = credit_repo
+        self._packages_cache: dict[str | None, tuple[float, list[CreditPackageResponse]]] = {}
+        self._currencies_cache: tuple[float, list[str]] | None = None
 
     async def get_credit_balance(self, user_id: UUID) -> CreditBalanceResponse:
         """Get the credit balance for a user."""
         try:
-            # Retrieve the credit balance from the repository
-            credit_balance = await self.credit_repo.get_credit_balance(user_id)
+            # Retrieve the credit balance from the repository, sharing one query between
+            # concurrent requests for the same user
+            credit_balance = await run_once(
+                ("credit_balance", user_id), lambda: self.credit_repo.get_credit_balance(user_id)
+            )
             if not credit_balance:
                 raise CreditOperationError("Credit balance not found")
 
@@ -44,7 +54,7 @@ class CreditService:
             logger.error(f"Repository error while fetching credit balance: {e}")
             raise CreditOperationError(f"Failed to fetch credit balance: {e}") from e
 
-    async def get_credit_packages(self, currency: str | None = None) -> Sequence[CreditPackageResponse]:
+    async def get_credit_packages(self, currency: str | None = None) -> list[CreditPackageResponse]:
         """Get all active credit packages.
 
         Args:
@@ -57,9 +67,20 @@ class CreditService:
             CreditOperationError: If there's an error fetching the packages.
 
         """
+        cache_key = currency.lower() if currency else None
+        cached = self._packages_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
         try:
-            packages = await self.credit_repo.get_active_packages(currency)
-            return [CreditPackageResponse.model_validate(package) for package in packages]
+            packages = await run_once(
+                ("credit_packages", cache_key), lambda: self.credit_repo.get_active_packages(currency)
+            )
+            responses = [CreditPackageResponse.model_validate(package) for package in packages]
+            # Only cache non-empty results so arbitrary currency codes cannot grow the cache
+            if responses:
+                self._packages_cache[cache_key] = (time.monotonic() + CATALOG_CACHE_TTL_SECONDS, responses)
+            return responses
         except RepositoryError as e:
             logger.error(f"Repository error while fetching credit packages: {e}")
             raise CreditOperationError(f"Failed to fetch credit packages: {e}") from e
@@ -77,8 +98,14 @@ class CreditService:
             CreditOperationError: If there's an error fetching the currencies.
 
         """
+        cached = self._currencies_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
         try:
-            return await self.credit_repo.get_available_currencies()
+            currencies = await self.credit_repo.get_available_currencies()
+            self._currencies_cache = (time.monotonic() + CATALOG_CACHE_TTL_SECONDS, currencies)
+            return currencies
         except RepositoryError as e:
             logger.error(f"Repository error while fetching currencies: {e}")
             raise CreditOperationError(f"Failed to fetch currencies: {e}") from e
@@ -179,8 +206,10 @@ class CreditService:
 
         """
         try:
-            # Get current balance
-            credit_balance = await self.credit_repo.get_credit_balance(user_id)
+            # Get current balance, sharing the query with concurrent balance reads for the user
+            credit_balance = await run_once(
+                ("credit_balance", user_id), lambda: self.credit_repo.get_credit_balance(user_id)
+            )
             if not credit_balance:
                 raise CreditOperationError("Credit balance not found")
 
@@ -222,36 +251,31 @@ class CreditService:
             Response containing success status, remaining credits and transaction ID
 
         Raises:
-            CreditOperationError: If there's an error spending credits or insufficient balance
+            InsufficientCreditsError: If the balance does not cover the amount
+            CreditOperationError: If there's an error spending credits
 
         """
         try:
-            # Get current balance
-            credit_balance = await self.credit_repo.get_credit_balance(user_id)
-            if not credit_balance:
-                raise CreditOperationError("Credit balance not found")
-
-            # Check if user has enough credits
-            if credit_balance.balance < amount:
-                raise CreditOperationError("Insufficient credits")
-
-            # Create transaction with negative amount to deduct credits
-            transaction = await self.credit_repo.add_credits(
-                user_id=user_id,
-                amount=-amount,  # Negative amount to deduct credits
-                transaction_type=TransactionType.USAGE,
-                description="Credits spent",
-            )
-
+            # Check, deduct and record in one statement
+            spent = await self.credit_repo.spend_credits(user_id, amount, "Credits spent")
+            if spent is None:
+                # Only the failure path looks at the balance, to tell a missing one apart
+                if await self.credit_repo.get_credit_balance(user_id) is None:
+                    raise CreditOperationError("Credit balance not found")
+                raise InsufficientCreditsError("Insufficient credits")
+
+            remaining_credits, transaction_id = spent
             return SpendCreditsResponse(
                 success=True,
-                remaining_credits=transaction.balance_after,
-                transaction_id=transaction.id,
+                remaining_credits=remaining_credits,
+                transaction_id=transaction_id,
             )
 
         except RepositoryError as e:
             logger.error(f"Repository error while spending credits: {e}")
             raise CreditOperationError(f"Failed to spend credits: {e}") from e
+        except CreditOperationError:
+            raise
         except Exception as e:
             logger.error(f"Unexpected error while spending credits: {e}")
             raise CreditOperationError(f"Failed to spend credits: {e}") from e
@@ -50,7 +50,7 @@ class InvestorFinder:
     async def generate_embedding(self, prompt: str) -> list[float]:
         """Generate embedding vector for search prompt."""
         try:
-            logger.debug(f"Generating embedding for prompt: {prompt}...")
+            logger.debug("Generating embedding for prompt: {}...", prompt)
             embedding = await self.openai_client.embeddings.create(input=prompt, model=self.embedding_model_name)
             query_embedding = embedding.data[0].embedding
             logger.info(f"✅ Generated embedding vector (length: {len(query_embedding)})")
@@ -64,7 +64,7 @@ class InvestorFinder:
     ) -> list[InvestorMatchResult]:
         """Retrieve and validate investor leads from the database."""
         try:
-            logger.debug(f"Querying database with threshold {threshold}, limit {limit}")
+            logger.debug("Querying database with threshold {}, limit {}", threshold, limit)
 
             # Convert embedding list to PostgreSQL vector string format
             embedding_str = "[" + ",".join(map(str, embedding)) + "]"
@@ -106,7 +106,7 @@ class InvestorFinder:
                 validated.append(InvestorMatchResult(investor=investor, similarity=similarity, raw_data=dict(item)))
             except Exception as e:
                 logger.error(f"Skipping invalid investor data at index {idx}: {e!s}")
-                logger.debug(f"Problematic data: {item}")
+                logger.debug("Problematic data: {}", item)
         return validated
 
     async def generate_reason(
@@ -131,7 +131,7 @@ class InvestorFinder:
             )
 
             result = await self.agent.run(full_prompt)
-            logger.debug(f"Generated reason: {result.data}")
+            logger.debug("Generated reason: {}", result.data)
             return result.data
         except Exception as e:
             logger.error(f"❌ Reason generation failed: {e!s}")
@@ -1,16 +1,75 @@
 """Service to orchestrate investor matching and LLM processing with streaming responses."""
 
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator
 from typing import Any
 
 from fastapi import HTTPException
 from fastapi.responses import StreamingResponse
 from loguru import logger
 from openai import AsyncOpenAI
+from pydantic_core import to_json
 
 from app.schemas.investor import InvestorMatchRequest, InvestorMatchResponse
 from app.services.investor_finder import InvestorFinder
 
+# SSE frames produced within this window are sent as one chunk, up to this many bytes
+SSE_COALESCE_MAX_DELAY_SECONDS = 0.05
+SSE_COALESCE_MAX_BYTES = 64 * 1024
+
+_SSE_DATA_PREFIX = b"data: "
+_SSE_ERROR_PREFIX = b"event: error\ndata: "
+_SSE_FRAME_END = b"\n\n"
+
+
+async def coalesce_frames(
+    frames: AsyncIterator[bytes],
+    max_bytes: int = SSE_COALESCE_MAX_BYTES,
+    max_delay: float = SSE_COALESCE_MAX_DELAY_SECONDS,
+) -> AsyncGenerator[bytes]:
+    """Merge SSE frames that arrive close together into larger chunks.
+
+    A chunk is sent once it reaches max_bytes, or once no further frame has arrived
+    within max_delay of the previous one, so a lone frame is delayed by at most max_delay.
+
+    Args:
+        frames: The SSE frames to send.
+        max_bytes: Size at which a chunk is sent without waiting for more frames.
+        max_delay: Time to wait for a further frame before sending the chunk.
+
+    Yields:
+        Encoded chunks of one or more complete frames.
+
+    """
+    buffer = bytearray()
+    iterator = aiter(frames)
+    next_frame: asyncio.Future[bytes] | None = None
+    try:
+        while True:
+            if next_frame is None:
+                next_frame = asyncio.ensure_future(anext(iterator))
+            # Wait indefinitely for the first frame of a chunk, then only briefly for more
+            done, _ = await asyncio.wait({next_frame}, timeout=max_delay if buffer else None)
+            if not done:
+                yield bytes(buffer)
+                buffer.clear()
+                continue
+
+            finished, next_frame = next_frame, None
+            try:
+                buffer += finished.result()
+            except StopAsyncIteration:
+                break
+            if len(buffer) >= max_bytes:
+                yield bytes(buffer)
+                buffer.clear()
+
+        if buffer:
+            yield bytes(buffer)
+    finally:
+        if next_frame is not None:
+            next_frame.cancel()
+
 
 class InvestorOracle:
     """Orchestrates investor matching and LLM processing with streaming responses."""
@@ -50,7 +109,7 @@ class InvestorOracle:
         """
         try:
             return StreamingResponse(
-                self._stream_matches(request),
+                coalesce_frames(self._stream_matches(request)),
                 media_type="text/event-stream",
             )
         except Exception as exc:
@@ -63,7 +122,7 @@ class InvestorOracle:
     async def _stream_matches(
         self,
         request: InvestorMatchRequest,
-    ) -> AsyncGenerator[str, Any]:
+    ) -> AsyncGenerator[bytes, Any]:
         """Stream processed investor matches.
 
         Args:
@@ -72,7 +131,7 @@ class InvestorOracle:
             openai_client: OpenAI client for embeddings
 
         Yields:
-            Processed investor match responses as SSE events
+            Processed investor match responses as UTF-8 encoded SSE events
 
         """
         try:
@@ -113,10 +172,10 @@ class InvestorOracle:
                     geographies=match.investor.geographies,
                 )
 
-                # Stream response as SSE event
-                yield f"data: {response.model_dump_json()}\n\n"
+                # Stream response as SSE event, serialized straight to UTF-8 bytes
+                yield _SSE_DATA_PREFIX + to_json(response) + _SSE_FRAME_END
 
         except Exception as exc:
             logger.error(f"Error streaming matches: {exc}")
-            yield f"event: error\ndata: {exc!s}\n\n"
+            yield _SSE_ERROR_PREFIX + str(exc).encode() + _SSE_FRAME_END
             return